@@ -19,6 +19,7 @@ from ref_builder.models.otu import OTU
 from ref_builder.models.plan import Plan, Segment, SegmentName, SegmentRule
 from ref_builder.models.sequence import Sequence
 from ref_builder.repo import Repo
+from ref_builder.utils import write_file_atomically
 
 
 def _get_molecule_string(molecule: Molecule) -> str:
@@ -282,12 +283,12 @@ def build_json(output_path: Path, path: Path, version: str) -> Path:
         otus=otus,
     )
 
-    with open(output_path, "wb") as f:
-        f.write(
-            orjson.dumps(
-                production_reference.model_dump(mode="json"),
-            ),
-        )
+    write_file_atomically(
+        output_path,
+        orjson.dumps(
+            production_reference.model_dump(mode="json"),
+        ),
+    )
 
     if not output_path.exists():
         raise FileNotFoundError(f"Built reference not found at {output_path}.")
@@ -13,7 +13,7 @@ from ref_builder.console import (
     print_otu_event_log,
     print_otu_list,
 )
-from ref_builder.errors import OTUExistsError
+from ref_builder.errors import DuplicateAccessionError, OTUExistsError
 from ref_builder.ncbi.client import NCBIClient
 from ref_builder.repo import Repo, locked_repo
 from ref_builder.services.cls import Services
@@ -81,7 +81,7 @@ def otu_create(
                 err=True,
             )
             sys.exit(1)
-    except ValueError as e:
+    except (DuplicateAccessionError, ValueError) as e:
         click.echo(e, err=True)
         sys.exit(1)
 
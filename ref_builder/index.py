@@ -3,11 +3,15 @@
 import binascii
 import datetime
 import sqlite3
-from collections.abc import Iterator
+from collections import defaultdict
+from collections.abc import Collection, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from uuid import UUID
 
+import orjson
+
 from ref_builder.events.base import EventMetadata
 from ref_builder.models.otu import OTU, OTUMinimal
 
@@ -23,6 +27,20 @@ class EventIndexItem:
     """The OTU ID this cache index is associated with."""
 
 
+@dataclass
+class OTUTimestamps:
+    """The timestamps used to decide whether an OTU is due for an update."""
+
+    first_created: datetime.datetime
+    """The timestamp of the first event associated with the OTU."""
+
+    last_modified: datetime.datetime
+    """The timestamp of the latest event associated with the OTU."""
+
+    last_updated: datetime.datetime | None
+    """The timestamp of the latest completed update, if the OTU has been updated."""
+
+
 @dataclass
 class Snapshot:
     """A snapshot of an OTU at a specific event."""
@@ -134,6 +152,15 @@ class Index:
             """,
         )
 
+        self.con.execute(
+            """
+            CREATE TABLE IF NOT EXISTS otu_unused_accessions (
+                otu_id TEXT,
+                accession_key TEXT
+            );
+            """,
+        )
+
         self.con.execute(
             """
             CREATE TABLE IF NOT EXISTS otu_taxids (
@@ -161,6 +188,7 @@ class Index:
             ("sequences", "otu_id"),
             ("sequences", "crc"),
             ("otu_updates", "otu_id"),
+            ("otu_unused_accessions", "otu_id"),
             ("otu_taxids", "otu_id"),
             ("otu_taxids", "taxid"),
             ("sequence_keys", "accession_key"),
@@ -174,6 +202,27 @@ class Index:
 
         self.con.commit()
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group index writes into a single SQLite transaction.
+
+        The connection otherwise autocommits every statement. Nested calls join the
+        outer transaction. All writes are rolled back if an exception is raised.
+        """
+        if self.con.in_transaction:
+            yield
+            return
+
+        self.con.execute("BEGIN")
+
+        try:
+            yield
+        except BaseException:
+            self.con.rollback()
+            raise
+
+        self.con.commit()
+
     @property
     def otu_ids(self) -> set[UUID]:
         """A list of all OTUs tracked in the index."""
@@ -282,6 +331,47 @@ class Index:
 
         return None
 
+    def get_otu_timestamps(self) -> dict[UUID, OTUTimestamps]:
+        """Get the event and update timestamps of every OTU in the index.
+
+        This reads all timestamps in two queries rather than three per OTU.
+
+        :return: the timestamps keyed by OTU ID
+        """
+        last_updated = {
+            otu_id: datetime.datetime.fromisoformat(timestamp)
+            for otu_id, timestamp in self.con.execute(
+                """
+                SELECT otu_id AS "otu_id [uuid]", timestamp_complete
+                FROM otu_updates
+                WHERE id IN (SELECT MAX(id) FROM otu_updates GROUP BY otu_id)
+                """,
+            )
+        }
+
+        return {
+            otu_id: OTUTimestamps(
+                first_created=first_created,
+                last_modified=last_modified,
+                last_updated=last_updated.get(otu_id),
+            )
+            for otu_id, first_created, last_modified in self.con.execute(
+                """
+                SELECT
+                    bounds.otu_id AS "otu_id [uuid]",
+                    first.timestamp AS "first_created [datetime]",
+                    last.timestamp AS "last_modified [datetime]"
+                FROM (
+                    SELECT otu_id, MIN(event_id) AS first_id, MAX(event_id) AS last_id
+                    FROM events
+                    GROUP BY otu_id
+                ) AS bounds
+                JOIN events AS first ON first.event_id = bounds.first_id
+                JOIN events AS last ON last.event_id = bounds.last_id
+                """,
+            )
+        }
+
     def get_id_by_taxid(self, taxid: int) -> UUID | None:
         """Get an OTU ID by any taxonomy ID in its lineage.
 
@@ -298,6 +388,28 @@ class Index:
 
         return None
 
+    def get_ids_by_taxids(self, taxids: Collection[int]) -> dict[int, UUID]:
+        """Get the OTU IDs for any taxonomy IDs in their lineages.
+
+        Taxonomy IDs that are not found are omitted from the returned dictionary.
+
+        :param taxids: the taxonomy IDs to search for
+        :return: a dictionary of OTU IDs keyed by taxonomy ID
+        """
+        if not taxids:
+            return {}
+
+        placeholders = ",".join("?" for _ in taxids)
+
+        # Only "?" placeholders are interpolated. The values are bound as parameters.
+        return dict(
+            self.con.execute(
+                'SELECT taxid, otu_id AS "otu_id [uuid]" FROM otu_taxids '  # noqa: S608
+                f"WHERE taxid IN ({placeholders})",
+                list(taxids),
+            ).fetchall()
+        )
+
     def get_id_by_isolate_id(self, isolate_id: UUID) -> UUID | None:
         """Get an OTU ID from an isolate ID that belongs to it."""
         cursor = self.con.execute(
@@ -327,6 +439,31 @@ class Index:
 
         return None
 
+    def get_otu_ids_by_accession_keys(
+        self,
+        accession_keys: Collection[str],
+    ) -> dict[str, UUID]:
+        """Get the OTU IDs that currently own the given accession keys.
+
+        Keys that are not owned by any OTU are omitted from the returned dictionary.
+
+        :param accession_keys: the accession keys to look up
+        :return: a dictionary of OTU IDs keyed by accession key
+        """
+        if not accession_keys:
+            return {}
+
+        placeholders = ",".join("?" for _ in accession_keys)
+
+        # Only "?" placeholders are interpolated. The values are bound as parameters.
+        return dict(
+            self.con.execute(
+                'SELECT accession_key, otu_id AS "otu_id [uuid]" FROM sequence_keys '  # noqa: S608
+                f"WHERE accession_key IN ({placeholders})",
+                list(accession_keys),
+            ).fetchall()
+        )
+
     def iter_accession_keys(self) -> Iterator[tuple[str, UUID]]:
         """Iterate over all (accession_key, otu_id) pairs in the index."""
         cursor = self.con.execute(
@@ -343,40 +480,39 @@ class Index:
 
         :param otu_id: the ID of the OTU to remove.
         """
-        self.con.execute(
-            "DELETE FROM isolates WHERE otu_id = ?",
-            (otu_id,),
-        )
-
-        self.con.execute(
-            "DELETE FROM otus WHERE id = ?",
-            (otu_id,),
-        )
+        with self.transaction():
+            self.con.execute(
+                "DELETE FROM isolates WHERE otu_id = ?",
+                (otu_id,),
+            )
 
-        self.con.execute(
-            "DELETE FROM sequences WHERE otu_id = ?",
-            (otu_id,),
-        )
+            self.con.execute(
+                "DELETE FROM otus WHERE id = ?",
+                (otu_id,),
+            )
 
-        self.con.execute(
-            "DELETE FROM otu_taxids WHERE otu_id = ?",
-            (otu_id,),
-        )
+            self.con.execute(
+                "DELETE FROM sequences WHERE otu_id = ?",
+                (otu_id,),
+            )
 
-        self.con.execute(
-            "DELETE FROM sequence_keys WHERE otu_id = ?",
-            (otu_id,),
-        )
+            self.con.execute(
+                "DELETE FROM otu_taxids WHERE otu_id = ?",
+                (otu_id,),
+            )
 
-        self.con.commit()
+            self.con.execute(
+                "DELETE FROM sequence_keys WHERE otu_id = ?",
+                (otu_id,),
+            )
 
     def iter_event_metadata(self) -> Iterator[EventMetadata]:
         """Iterate over event metadata."""
-        rows = self.con.execute(
+        cursor = self.con.execute(
             "SELECT event_id, otu_id, timestamp FROM events ORDER BY event_id",
-        ).fetchall()
+        )
 
-        for row in rows:
+        for row in cursor:
             yield EventMetadata(
                 id=row[0],
                 otu_id=UUID(row[1]) if row[1] else None,
@@ -385,14 +521,14 @@ class Index:
 
     def iter_minimal_otus(self) -> Iterator[OTUMinimal]:
         """Iterate over minimal representations of all OTUs in the index."""
-        rows = self.con.execute(
+        cursor = self.con.execute(
             """
             SELECT acronym, id AS "id [uuid]", name, taxid
             FROM otus ORDER BY name
             """,
-        ).fetchall()
+        )
 
-        for row in rows:
+        for row in cursor:
             yield OTUMinimal(
                 acronym=row[0],
                 id=row[1],
@@ -416,20 +552,42 @@ class Index:
         return None
 
     def add_otu_update_history_entry(
-        self, otu_id: UUID, timestamp: datetime.datetime
+        self,
+        otu_id: UUID,
+        timestamp: datetime.datetime,
+        *,
+        unused_accession_keys: Collection[str] = (),
     ) -> int | None:
-        """Write an entry into the OTU update history."""
-        self.con.execute(
-            """
-            INSERT INTO
-            otu_updates(otu_id, timestamp_complete)
-            VALUES(?, ?)
-            """,
-            (
-                otu_id,
-                timestamp,
-            ),
-        )
+        """Write an entry into the OTU update history.
+
+        The unused accession keys recorded for the OTU are replaced with
+        ``unused_accession_keys``.
+        """
+        with self.transaction():
+            self.con.execute(
+                """
+                INSERT INTO
+                otu_updates(otu_id, timestamp_complete)
+                VALUES(?, ?)
+                """,
+                (
+                    otu_id,
+                    timestamp,
+                ),
+            )
+
+            self.con.execute(
+                "DELETE FROM otu_unused_accessions WHERE otu_id = ?",
+                (otu_id,),
+            )
+
+            self.con.executemany(
+                """
+                INSERT INTO otu_unused_accessions (otu_id, accession_key)
+                VALUES (?, ?)
+                """,
+                [(otu_id, key) for key in unused_accession_keys],
+            )
 
         cursor = self.con.execute(
             "SELECT id FROM otu_updates WHERE otu_id = ? ORDER BY id DESC",
@@ -441,6 +599,23 @@ class Index:
 
         return None
 
+    def get_unused_accession_keys(self) -> dict[UUID, set[str]]:
+        """Get the accession keys left unused by the latest update of each OTU.
+
+        :return: the unused accession keys keyed by OTU ID
+        """
+        unused_accession_keys = defaultdict(set)
+
+        for otu_id, accession_key in self.con.execute(
+            """
+            SELECT otu_id AS "otu_id [uuid]", accession_key
+            FROM otu_unused_accessions
+            """,
+        ):
+            unused_accession_keys[otu_id].add(accession_key)
+
+        return dict(unused_accession_keys)
+
     def load_snapshot(self, otu_id: UUID) -> Snapshot | None:
         """Load an OTU snapshot."""
         cursor = self.con.execute(
@@ -455,14 +630,17 @@ class Index:
 
         at_event, otu_json = result
 
-        otu = OTU.model_validate_json(otu_json)
+        # Substitute sequences into the raw data so the OTU is only validated once.
+        otu_data = orjson.loads(otu_json)
 
-        accessions = [
-            str(sequence.accession)
-            for isolate in otu.isolates
-            for sequence in isolate.sequences
+        sequences = [
+            sequence
+            for isolate in otu_data["isolates"]
+            for sequence in isolate["sequences"]
         ]
 
+        accessions = [sequence["accession"] for sequence in sequences]
+
         # Fetch all sequences in a single query
         placeholders = ",".join("?" for _ in accessions)
 
@@ -476,14 +654,13 @@ class Index:
         # Update the data structure and check for missing sequences
         missing_sequences = []
 
-        for isolate in otu.isolates:
-            for sequence in isolate.sequences:
-                accession = str(sequence.accession)
+        for sequence in sequences:
+            accession = sequence["accession"]
 
-                if accession in sequence_map:
-                    sequence.sequence = sequence_map[accession]
-                else:
-                    missing_sequences.append(accession)
+            if accession in sequence_map:
+                sequence["sequence"] = sequence_map[accession]
+            else:
+                missing_sequences.append(accession)
 
         # Raise an error if any sequences are missing
         if missing_sequences:
@@ -491,7 +668,7 @@ class Index:
 
         return Snapshot(
             at_event=at_event,
-            otu=OTU.model_validate(otu),
+            otu=OTU.model_validate(otu_data),
         )
 
     def upsert_otu(self, otu: OTU, at_event: int) -> None:
@@ -502,106 +679,107 @@ class Index:
 
         Only sequences that have changed will be updated.
         """
-        accessions = {
-            str(sequence.accession)
-            for isolate in otu.isolates
-            for sequence in isolate.sequences
-        }
-
-        placeholders = ",".join("?" for _ in accessions)
-
-        # Delete any sequences that are no longer in the OTU.
-        self.con.execute(
-            f"""
-            DELETE FROM sequences WHERE otu_id = ? AND NOT accession IN ({placeholders});
-            """,
-            (otu.id, *accessions),
-        )
+        with self.transaction():
+            accessions = {
+                str(sequence.accession)
+                for isolate in otu.isolates
+                for sequence in isolate.sequences
+            }
 
-        batch = []
+            placeholders = ",".join("?" for _ in accessions)
 
-        # Insert or update the isolates.
-        for isolate in otu.isolates:
+            # Delete any sequences that are no longer in the OTU.
             self.con.execute(
-                "INSERT OR REPLACE INTO isolates (id, name, otu_id) VALUES (?, ?, ?)",
-                (
-                    isolate.id,
-                    str(isolate.name),
-                    otu.id,
-                ),
+                f"""
+                DELETE FROM sequences
+                WHERE otu_id = ? AND NOT accession IN ({placeholders});
+                """,
+                (otu.id, *accessions),
             )
 
-            for sequence in isolate.sequences:
-                crc = _calculate_crc32(sequence.sequence)
-                batch.append(
+            batch = []
+
+            # Insert or update the isolates.
+            for isolate in otu.isolates:
+                self.con.execute(
+                    "INSERT OR REPLACE INTO isolates (id, name, otu_id) "
+                    "VALUES (?, ?, ?)",
                     (
-                        str(sequence.accession),
-                        crc,
+                        isolate.id,
+                        str(isolate.name),
                         otu.id,
-                        sequence.sequence,
                     ),
                 )
 
-        self.con.executemany(
-            """
-            INSERT OR REPLACE INTO sequences (accession, crc, otu_id, sequence)
-            VALUES (?, ?, ?, ?)
-            """,
-            batch,
-        )
-
-        # Update only if CRC has changed
-        self.con.executemany(
-            """
-            UPDATE sequences
-            SET crc = ?, otu_id = ?, sequence = ?
-            WHERE accession = ? AND crc != ?
-            """,
-            [(crc, otu_id, seq, seq_id, crc) for seq_id, crc, otu_id, seq in batch],
-        )
+                for sequence in isolate.sequences:
+                    crc = _calculate_crc32(sequence.sequence)
+                    batch.append(
+                        (
+                            str(sequence.accession),
+                            crc,
+                            otu.id,
+                            sequence.sequence,
+                        ),
+                    )
+
+            self.con.executemany(
+                """
+                INSERT OR REPLACE INTO sequences (accession, crc, otu_id, sequence)
+                VALUES (?, ?, ?, ?)
+                """,
+                batch,
+            )
 
-        self.con.execute(
-            """
-            INSERT OR REPLACE INTO otus (id, acronym, at_event, name, otu, taxid)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                otu.id,
-                otu.acronym,
-                at_event,
-                otu.name,
-                otu.model_dump_json(),
-                otu.taxid,
-            ),
-        )
+            # Update only if CRC has changed
+            self.con.executemany(
+                """
+                UPDATE sequences
+                SET crc = ?, otu_id = ?, sequence = ?
+                WHERE accession = ? AND crc != ?
+                """,
+                [(crc, otu_id, seq, seq_id, crc) for seq_id, crc, otu_id, seq in batch],
+            )
 
-        # Delete and re-insert taxids for this OTU
-        self.con.execute(
-            "DELETE FROM otu_taxids WHERE otu_id = ?",
-            (otu.id,),
-        )
+            self.con.execute(
+                """
+                INSERT OR REPLACE INTO otus (id, acronym, at_event, name, otu, taxid)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    otu.id,
+                    otu.acronym,
+                    at_event,
+                    otu.name,
+                    otu.model_dump_json(),
+                    otu.taxid,
+                ),
+            )
 
-        self.con.executemany(
-            "INSERT INTO otu_taxids (otu_id, taxid) VALUES (?, ?)",
-            [(otu.id, taxon.id) for taxon in otu.lineage.taxa],
-        )
+            # Delete and re-insert taxids for this OTU
+            self.con.execute(
+                "DELETE FROM otu_taxids WHERE otu_id = ?",
+                (otu.id,),
+            )
 
-        # Delete and re-insert accession keys for this OTU
-        self.con.execute(
-            "DELETE FROM sequence_keys WHERE otu_id = ?",
-            (otu.id,),
-        )
+            self.con.executemany(
+                "INSERT INTO otu_taxids (otu_id, taxid) VALUES (?, ?)",
+                [(otu.id, taxon.id) for taxon in otu.lineage.taxa],
+            )
 
-        self.con.executemany(
-            "INSERT INTO sequence_keys (accession_key, otu_id) VALUES (?, ?)",
-            [
-                (sequence.accession.key, otu.id)
-                for isolate in otu.isolates
-                for sequence in isolate.sequences
-            ],
-        )
+            # Delete and re-insert accession keys for this OTU
+            self.con.execute(
+                "DELETE FROM sequence_keys WHERE otu_id = ?",
+                (otu.id,),
+            )
 
-        self.con.commit()
+            self.con.executemany(
+                "INSERT INTO sequence_keys (accession_key, otu_id) VALUES (?, ?)",
+                [
+                    (sequence.accession.key, otu.id)
+                    for isolate in otu.isolates
+                    for sequence in isolate.sequences
+                ],
+            )
 
     def prune(self, event_id: int) -> None:
         """Rollback the index to a previous event.
@@ -614,21 +792,20 @@ class Index:
 
         :param event_id: the event ID to rollback to
         """
-        self.con.execute(
-            """
-            DELETE FROM events WHERE event_id > ?
-            """,
-            (event_id,),
-        )
-
-        self.con.execute(
-            """
-            DELETE FROM otus WHERE at_event > ?
-            """,
-            (event_id,),
-        )
+        with self.transaction():
+            self.con.execute(
+                """
+                DELETE FROM events WHERE event_id > ?
+                """,
+                (event_id,),
+            )
 
-        self.con.commit()
+            self.con.execute(
+                """
+                DELETE FROM otus WHERE at_event > ?
+                """,
+                (event_id,),
+            )
 
 
 def _calculate_crc32(sequence: str) -> str:
@@ -2,7 +2,7 @@ import logging
 import os
 
 import structlog
-from structlog.typing import Processor
+from structlog.typing import EventDict, Processor, WrappedLogger
 
 NO_COLOR = os.environ.get("NO_COLOR") is not None
 
@@ -19,6 +19,7 @@ def configure_logger(verbosity: int, no_color: bool = False) -> None:
     processors: list[Processor] = [
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
+        _sort_sets,
     ]
 
     if verbosity == 0:
@@ -47,3 +48,19 @@ def configure_logger(verbosity: int, no_color: bool = False) -> None:
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(level),
     )
+
+
+def _sort_sets(_: WrappedLogger, __: str, event_dict: EventDict) -> EventDict:
+    """Render set values as sorted lists.
+
+    Sets can be passed to log calls as-is. They are only sorted for events that pass
+    level filtering and are actually rendered.
+    """
+    for key, value in event_dict.items():
+        if isinstance(value, set | frozenset):
+            try:
+                event_dict[key] = sorted(value)
+            except TypeError:
+                event_dict[key] = list(value)
+
+    return event_dict
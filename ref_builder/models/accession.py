@@ -1,16 +1,18 @@
 import re
 from dataclasses import dataclass
 
-REFSEQ_ACCESSION_PATTERN = re.compile(pattern=r"^NC_[0-9A-Z]+$")
+REFSEQ_ACCESSION_PATTERN = re.compile(pattern=r"NC_[0-9A-Z]+")
 """RefSeq accession pattern for viral complete genomic molecules (NC_ prefix).
 
 The identifier following the underscore can be alphanumeric and of variable length.
+The pattern is unanchored so it can be combined with others. Use it with
+``fullmatch``.
 
 Examples: NC_003619, NC_010314, NC_ABC123
 """
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Accession:
     """A Genbank accession number."""
 
@@ -34,22 +36,20 @@ class Accession:
         if not string or not string.strip():
             raise ValueError("Accession string cannot be empty or whitespace.")
 
-        parts = string.split(".")
+        key, period, string_version = string.partition(".")
 
-        if len(parts) < 2:
+        if not period:
             raise ValueError(
                 f'Accession string "{string}" does not contain two parts '
                 "delimited by a period. Expected format: KEY.VERSION (e.g., NC_123456.1)"
             )
 
-        if len(parts) > 2:
+        if "." in string_version:
             raise ValueError(
                 f'Accession string "{string}" contains multiple periods. '
                 "Expected format: KEY.VERSION (e.g., NC_123456.1)"
             )
 
-        key, string_version = parts
-
         if not string_version.isdigit():
             raise ValueError(
                 f"Accession version ({string_version}) is not an integer. "
@@ -71,4 +71,4 @@ class Accession:
     @property
     def is_refseq(self) -> bool:
         """Return True if this accession is from NCBI's RefSeq database."""
-        return REFSEQ_ACCESSION_PATTERN.match(self.key) is not None
+        return REFSEQ_ACCESSION_PATTERN.fullmatch(self.key) is not None
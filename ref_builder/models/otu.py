@@ -45,6 +45,12 @@ class OTU(BaseModel):
     _sequences_by_accession: dict[str, Sequence] = PrivateAttr()
     """A dictionary of sequences indexed by accession key"""
 
+    _accessions: frozenset[str] = PrivateAttr()
+    """The accession keys of all sequences in the OTU"""
+
+    _versioned_accessions: frozenset[Accession] = PrivateAttr()
+    """The versioned accessions of all sequences in the OTU"""
+
     id: UUID4
     """The OTU id."""
 
@@ -120,6 +126,10 @@ class OTU(BaseModel):
             for isolate in self.isolates
             for sequence in isolate.sequences
         }
+        self._accessions = frozenset(self._sequences_by_accession)
+        self._versioned_accessions = frozenset(
+            sequence.accession for sequence in self._sequences_by_accession.values()
+        )
         return self
 
     def get_isolate(self, isolate_id: UUID4) -> Isolate | None:
@@ -153,9 +163,9 @@ class OTU(BaseModel):
         return self._sequences_by_accession.get(accession)
 
     @property
-    def accessions(self) -> set[str]:
-        """A set of accessions contained in this isolate."""
-        return {accession.key for accession in self.versioned_accessions}
+    def accessions(self) -> frozenset[str]:
+        """A set of accessions contained in this OTU."""
+        return self._accessions
 
     @property
     def acronym(self) -> str:
@@ -168,7 +178,7 @@ class OTU(BaseModel):
         return self.lineage.name
 
     @property
-    def blocked_accessions(self) -> set[str]:
+    def blocked_accessions(self) -> frozenset[str]:
         """Accessions that should not be considered for addition to the OTU.
 
         This includes:
@@ -202,13 +212,9 @@ class OTU(BaseModel):
         return self.lineage.taxa[0].id
 
     @property
-    def versioned_accessions(self) -> set[Accession]:
+    def versioned_accessions(self) -> frozenset[Accession]:
         """A set of versioned accessions contained in this OTU."""
-        return {
-            sequence.accession
-            for isolate in self.isolates
-            for sequence in isolate.sequences
-        }
+        return self._versioned_accessions
 
     @field_validator("plan", mode="after")
     def check_plan_required(cls, plan: Plan) -> Plan:
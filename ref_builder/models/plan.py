@@ -1,5 +1,7 @@
+import math
 import re
 from enum import StrEnum
+from functools import cached_property
 from typing import Optional
 from uuid import UUID, uuid4
 
@@ -149,6 +151,22 @@ class Segment(BaseModel):
         )
 
 
+def get_segments_min_length(segments: list[Segment]) -> int:
+    """Return the shortest minimum length from a list of segments."""
+    shortest_segment = min(segments, key=lambda s: s.length)
+
+    return math.floor(
+        shortest_segment.length * (1.0 - shortest_segment.length_tolerance)
+    )
+
+
+def get_segments_max_length(segments: list[Segment]) -> int:
+    """Return the longest maximum length from a list of segments."""
+    longest_segment = max(segments, key=lambda s: s.length)
+
+    return math.ceil(longest_segment.length * (1.0 + longest_segment.length_tolerance))
+
+
 class Plan(BaseModel):
     """The segments required for an isolate in a given OTU."""
 
@@ -191,6 +209,36 @@ class Plan(BaseModel):
             segment for segment in self.segments if segment.rule != SegmentRule.REQUIRED
         ]
 
+    @cached_property
+    def min_segment_length(self) -> int:
+        """The shortest sequence length accepted by any segment in the plan.
+
+        Plans are replaced rather than modified, so this is computed once per plan.
+        """
+        return get_segments_min_length(self.segments)
+
+    @cached_property
+    def max_segment_length(self) -> int:
+        """The longest sequence length accepted by any segment in the plan."""
+        return get_segments_max_length(self.segments)
+
+    @cached_property
+    def segments_by_name(self) -> dict[SegmentName | None, Segment]:
+        """Segments keyed by name.
+
+        The single segment of a monopartite plan may be keyed by ``None``.
+        """
+        return {segment.name: segment for segment in self.segments}
+
+    @cached_property
+    def segment_prefixes_by_key(self) -> dict[str, str]:
+        """Segment name prefixes keyed by segment name key."""
+        return {
+            segment.name.key: segment.name.prefix
+            for segment in self.segments
+            if segment.name is not None
+        }
+
     @classmethod
     def new(cls, segments: list[Segment]) -> "Plan":
         """Initialize a new Plan from a list of segments."""
@@ -6,6 +6,7 @@ from pathlib import Path
 import orjson
 
 from ref_builder.paths import user_cache_directory_path
+from ref_builder.utils import write_file_atomically
 
 
 class NCBICache:
@@ -35,8 +36,9 @@ class NCBICache:
         :param accession: The NCBI accession of the record
         :param version: The accession's version number
         """
-        with open(self._get_genbank_path(accession, version), "wb") as f:
-            f.write(orjson.dumps(data))
+        write_file_atomically(
+            self._get_genbank_path(accession, version), orjson.dumps(data)
+        )
 
     def load_genbank_record(
         self,
@@ -76,8 +78,7 @@ class NCBICache:
         :param data: NCBI Taxonomy record data
         :param taxid: A NCBI Taxonomy id
         """
-        with open(self._get_taxonomy_path(taxid), "wb") as f:
-            f.write(orjson.dumps(data))
+        write_file_atomically(self._get_taxonomy_path(taxid), orjson.dumps(data))
 
     def load_taxonomy(self, taxid: int) -> dict | None:
         """Load a cached NCBI Taxonomy record.
@@ -2,12 +2,16 @@
 
 import datetime
 import os
-from collections.abc import Collection, Iterator
+import threading
+import time
+from collections.abc import Callable, Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, suppress
 from enum import StrEnum
 from http import HTTPStatus
+from itertools import batched
 from typing import Protocol
-from urllib.error import HTTPError
+from urllib.error import HTTPError, URLError
 
 from Bio import Entrez
 from pydantic import ValidationError
@@ -32,6 +36,10 @@ if email := os.environ.get("NCBI_EMAIL"):
 if api_key := os.environ.get("NCBI_API_KEY"):
     Entrez.api_key = api_key  # ty: ignore[invalid-assignment]
 
+# Failed requests are retried with backoff by ``_start_entrez_request``. Biopython's own
+# retries would multiply the number of requests made for each attempt.
+Entrez.max_tries = 1
+
 logger = get_logger("ncbi")
 
 ESEARCH_PAGE_SIZE = 1000
@@ -40,6 +48,31 @@ ESEARCH_PAGE_SIZE = 1000
 EFETCH_BATCH_SIZE = 500
 """The number of records to fetch per batch in an Entrez efetch query."""
 
+ENTREZ_MAX_WORKERS = 3
+"""The maximum number of concurrent Entrez requests without an NCBI API key."""
+
+ENTREZ_MAX_WORKERS_WITH_API_KEY = 10
+"""The maximum number of concurrent Entrez requests with an NCBI API key."""
+
+ENTREZ_REQUEST_INTERVAL = 0.37
+"""The minimum number of seconds between Entrez request starts without an NCBI API key.
+
+This matches the spacing Biopython uses to respect the NCBI rate limit.
+"""
+
+ENTREZ_REQUEST_INTERVAL_WITH_API_KEY = 0.1
+"""The minimum number of seconds between Entrez request starts with an NCBI API key."""
+
+ENTREZ_RETRY_ATTEMPTS = 4
+"""The number of times a rate limited or failed Entrez request is retried.
+
+Biopython's own retries are disabled, so a single call makes at most one more request
+than this.
+"""
+
+ENTREZ_RETRY_DELAY = 1.0
+"""The delay in seconds before the first Entrez retry. It doubles for each retry."""
+
 DATE_TEMPLATE = "%Y/%m/%d"
 """The standard date format used by NCBI Entrez."""
 
@@ -66,6 +99,7 @@ class NCBIClientProtocol(Protocol):
         sequence_min_length: int = 0,
         sequence_max_length: int = 0,
         refseq_only: bool = False,
+        modification_date_start: datetime.date | None = None,
     ) -> list[Accession]: ...
 
     @staticmethod
@@ -99,6 +133,9 @@ class NCBIClient:
         self.cache = NCBICache()
         self.ignore_cache = ignore_cache
 
+        # Validated taxonomy records fetched during the lifetime of this client.
+        self._taxonomy_records: dict[int, NCBITaxonomy] = {}
+
     def fetch_genbank_records(
         self,
         accessions: Collection[str | Accession],
@@ -170,21 +207,17 @@ class NCBIClient:
                 accessions_to_fetch.append(str(accession))
 
         if accessions_to_fetch:
-            total_to_fetch = len(accessions_to_fetch)
-
-            for batch_start in range(0, total_to_fetch, EFETCH_BATCH_SIZE):
-                batch_end = min(batch_start + EFETCH_BATCH_SIZE, total_to_fetch)
-                batch = accessions_to_fetch[batch_start:batch_end]
-
-                log.debug(
-                    "Fetching batch...",
-                    batch_number=batch_start // EFETCH_BATCH_SIZE + 1,
-                    batch_size=len(batch),
-                    progress=f"{batch_end}/{total_to_fetch}",
-                )
+            batches = list(
+                batched(accessions_to_fetch, EFETCH_BATCH_SIZE, strict=False)
+            )
 
-                new_records = NCBIClient.fetch_unvalidated_genbank_records(batch)
+            log.debug(
+                "Fetching batches...",
+                batch_count=len(batches),
+                record_count=len(accessions_to_fetch),
+            )
 
+            for new_records in _fetch_genbank_batches(batches):
                 for record in new_records:
                     versioned_accession = Accession.from_string(
                         record[GenbankRecordKey.ACCESSION_VERSION],
@@ -218,7 +251,8 @@ class NCBIClient:
         try:
             with log_http_error():
                 try:
-                    handle = Entrez.efetch(
+                    handle = _start_entrez_request(
+                        Entrez.efetch,
                         db=NCBIDatabase.NUCCORE,
                         id=list(accessions),
                         rettype="gb",
@@ -257,6 +291,7 @@ class NCBIClient:
         sequence_min_length: int = 0,
         sequence_max_length: int = 0,
         refseq_only: bool = False,
+        modification_date_start: datetime.date | None = None,
     ) -> list[Accession]:
         """Fetch all accessions associated with the given ``taxid``.
 
@@ -264,6 +299,8 @@ class NCBIClient:
         :param sequence_min_length: The minimum length of a fetched sequence.
         :param sequence_max_length: The maximum length of a fetched sequence.
         :param refseq_only: Only fetch accessions from NCBI RefSeq database.:
+        :param modification_date_start: Only fetch accessions for records modified on
+            or after this date.
         :return: A list of Accession objects
         """
         log = logger.bind(taxid=taxid)
@@ -284,6 +321,13 @@ class NCBIClient:
         if refseq_only:
             search_terms.append("refseq[filter]")
 
+        if modification_date_start is not None:
+            search_terms.append(
+                NCBIClient.generate_date_filter_string(
+                    "MDAT", start_date=modification_date_start
+                )
+            )
+
         search_term_string = " AND ".join(search_terms)
 
         log.debug(
@@ -295,7 +339,8 @@ class NCBIClient:
             retstart = (page - 1) * ESEARCH_PAGE_SIZE
 
             with log_http_error():
-                handle = Entrez.esearch(
+                handle = _start_entrez_request(
+                    Entrez.esearch,
                     db=NCBIDatabase.NUCCORE,
                     term=search_term_string,
                     idtype="acc",
@@ -360,10 +405,16 @@ class NCBIClient:
         If the record rank has an invalid rank (e.g. "no data"), makes an additional
         docsum fetch and attempts to extract the rank data.
 
+        Validated records are kept in memory for the lifetime of the client, so lineage
+        building does not reload the same taxid from the cache or NCBI.
+
         :param taxid: A NCBI Taxonomy id
         :return: A validated NCBI Taxonomy record NCBITaxonomy if possible,
             else None
         """
+        if (taxonomy := self._taxonomy_records.get(taxid)) is not None:
+            return taxonomy
+
         log = logger.bind(taxid=taxid)
 
         record = None if self.ignore_cache else self.cache.load_taxonomy(taxid)
@@ -371,7 +422,8 @@ class NCBIClient:
         if record is None:
             with log_http_error():
                 try:
-                    handle = Entrez.efetch(
+                    handle = _start_entrez_request(
+                        Entrez.efetch,
                         db=NCBIDatabase.TAXONOMY,
                         id=taxid,
                         rettype="null",
@@ -392,8 +444,7 @@ class NCBIClient:
                 return None
 
         try:
-            return NCBITaxonomy.model_validate(record)
-
+            taxonomy = NCBITaxonomy.model_validate(record)
         except ValidationError as e:
             for error in e.errors():
                 log.warning(
@@ -406,7 +457,11 @@ class NCBIClient:
                 if error["type"] == "taxon_rank_too_high":
                     raise TaxonLevelError(error["msg"])
 
-        return None
+            return None
+
+        self._taxonomy_records[taxid] = taxonomy
+
+        return taxonomy
 
     def fetch_descendant_taxids(self, species_taxid: int) -> list[int]:
         """Fetch all descendant taxids under a species.
@@ -422,7 +477,8 @@ class NCBIClient:
         log.debug("Fetching descendant taxids...")
 
         with log_http_error():
-            handle = Entrez.esearch(
+            handle = _start_entrez_request(
+                Entrez.esearch,
                 db=NCBIDatabase.TAXONOMY,
                 term=f"txid{species_taxid}[Subtree]",
                 retmax=10000,
@@ -433,16 +489,22 @@ class NCBIClient:
         if not result["IdList"]:
             return []
 
-        descendant_taxids = [int(tid) for tid in result["IdList"]]
+        descendant_taxids = [
+            taxid for taxid in map(int, result["IdList"]) if taxid != species_taxid
+        ]
 
-        subspecific_taxids = []
-        for taxid in descendant_taxids:
-            if taxid == species_taxid:
-                continue
+        # Taxonomy records are fetched concurrently, up to the NCBI request rate limit.
+        with ThreadPoolExecutor(max_workers=get_entrez_max_workers()) as executor:
+            tax_records = executor.map(self.fetch_taxonomy_record, descendant_taxids)
 
-            tax_record = self.fetch_taxonomy_record(taxid)
-            if tax_record and tax_record.rank in (NCBIRank.ISOLATE, NCBIRank.NO_RANK):
-                subspecific_taxids.append(taxid)
+            subspecific_taxids = [
+                taxid
+                for taxid, tax_record in zip(
+                    descendant_taxids, tax_records, strict=True
+                )
+                if tax_record
+                and tax_record.rank in (NCBIRank.ISOLATE, NCBIRank.NO_RANK)
+            ]
 
         log.debug(
             "Found subspecific descendants",
@@ -592,6 +654,130 @@ class NCBIClient:
         )
 
 
+def get_entrez_max_workers() -> int:
+    """Return the number of Entrez requests that can be made concurrently.
+
+    This follows the NCBI E-utilities request rate limit, which is higher when an API
+    key is configured.
+    """
+    return ENTREZ_MAX_WORKERS_WITH_API_KEY if Entrez.api_key else ENTREZ_MAX_WORKERS
+
+
+def get_entrez_request_interval() -> float:
+    """Return the minimum number of seconds between Entrez request starts.
+
+    This follows the NCBI E-utilities request rate limit, which is higher when an API
+    key is configured.
+    """
+    if Entrez.api_key:
+        return ENTREZ_REQUEST_INTERVAL_WITH_API_KEY
+
+    return ENTREZ_REQUEST_INTERVAL
+
+
+class _EntrezRequestThrottle:
+    """Spaces out the starts of Entrez requests made from any thread.
+
+    Biopython's own throttle is not thread-safe. A start time is reserved while
+    holding a lock, and the wait for it happens after the lock is released. Waiting
+    callers and in-flight requests do not block each other.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self) -> None:
+        """Wait until an Entrez request can start without exceeding the rate limit."""
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + get_entrez_request_interval()
+
+        if start > now:
+            time.sleep(start - now)
+
+
+_entrez_request_throttle = _EntrezRequestThrottle()
+
+
+def _is_transient_entrez_error(error: Exception) -> bool:
+    """Return whether a failed Entrez request is worth retrying.
+
+    Rate limit and server errors are transient, as are timeouts and dropped
+    connections. Other errors, such as a failed DNS lookup or a refused connection,
+    will not resolve by retrying.
+    """
+    if isinstance(error, HTTPError):
+        return (
+            error.code == HTTPStatus.TOO_MANY_REQUESTS
+            or error.code >= HTTPStatus.INTERNAL_SERVER_ERROR
+        )
+
+    if isinstance(error, URLError):
+        return isinstance(error.reason, TimeoutError | ConnectionResetError)
+
+    return isinstance(error, TimeoutError | ConnectionResetError)
+
+
+def _start_entrez_request[T](request: Callable[..., T], **kwargs: object) -> T:
+    """Start an Entrez request, retrying rate limit, server and transient connection
+    errors with exponential backoff.
+
+    Each attempt waits for its own start slot. No lock is held during backoff delays
+    or requests, so other requests are not held up.
+
+    :param request: the Entrez function to call (eg. ``Entrez.efetch``)
+    :param kwargs: the arguments to pass to ``request``
+    :return: the result of ``request``
+    """
+    for attempt in range(ENTREZ_RETRY_ATTEMPTS):
+        _entrez_request_throttle.wait()
+
+        try:
+            return request(**kwargs)
+        except (URLError, TimeoutError, ConnectionResetError) as e:
+            if not _is_transient_entrez_error(e):
+                raise
+
+            error = e
+
+        delay = ENTREZ_RETRY_DELAY * 2**attempt
+
+        logger.warning(
+            "Retrying Entrez request.",
+            attempt=attempt + 1,
+            delay=delay,
+            error=str(error),
+        )
+
+        time.sleep(delay)
+
+    _entrez_request_throttle.wait()
+
+    return request(**kwargs)
+
+
+def _fetch_genbank_batches(batches: list[tuple[str, ...]]) -> Iterator[list[dict]]:
+    """Fetch batches of unvalidated Genbank records, concurrently if there are many.
+
+    Concurrency is capped at the NCBI E-utilities request rate limit, which is higher
+    when an API key is configured. Request starts are spaced out by
+    ``_start_entrez_request``. Results are yielded in batch order.
+
+    :param batches: batches of accessions to fetch
+    :return: an iterator of fetched records for each batch
+    """
+    if len(batches) == 1:
+        yield NCBIClient.fetch_unvalidated_genbank_records(batches[0])
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(get_entrez_max_workers(), len(batches))
+    ) as executor:
+        yield from executor.map(NCBIClient.fetch_unvalidated_genbank_records, batches)
+
+
 @contextmanager
 def log_http_error() -> Iterator[None]:
     """Log detailed HTTPError info for debugging before throwing the HTTPError."""
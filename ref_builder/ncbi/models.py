@@ -1,6 +1,7 @@
 """Models for NCBI Genbank and Taxonomy data."""
 
 from enum import StrEnum
+from functools import cached_property
 from typing import Annotated, Any
 
 from pydantic import (
@@ -14,6 +15,7 @@ from pydantic import (
 )
 from pydantic_core import PydanticCustomError
 
+from ref_builder.models.accession import Accession
 from ref_builder.models.molecule import Molecule, MoleculeType, Strandedness, Topology
 
 
@@ -144,6 +146,14 @@ class NCBIGenbank(BaseModel):
         """
         return self.accession.startswith("NC_")
 
+    @cached_property
+    def versioned_accession(self) -> Accession:
+        """The parsed versioned accession of the record.
+
+        This is parsed once per record and reused wherever the record is written.
+        """
+        return Accession.from_string(self.accession_version)
+
     @field_validator("sequence", mode="after")
     @classmethod
     def uppercase_sequence(cls, raw: str) -> str:
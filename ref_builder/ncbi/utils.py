@@ -1,19 +1,25 @@
 import re
 from collections import defaultdict
+from functools import lru_cache
 
 from ref_builder.models.accession import Accession
 from ref_builder.models.isolate import IsolateName, IsolateNameType
 from ref_builder.ncbi.models import NCBIGenbank
 
+REFSEQ_COMMENT_PATTERN = re.compile(r"^(\w+ REFSEQ): [\w ]+. [\w ]+ (\w+).")
+"""Regex pattern for parsing the status and source accession from a RefSeq comment."""
 
+
+@lru_cache(maxsize=4096)
 def parse_refseq_comment(comment: str) -> tuple[str, str]:
-    """Parse a standard RefSeq comment."""
+    """Parse a standard RefSeq comment.
+
+    Results are cached as the same comment is parsed repeatedly during updates.
+    """
     if not comment:
         raise ValueError("Empty comment")
 
-    pattern = re.compile(r"^(\w+ REFSEQ): [\w ]+. [\w ]+ (\w+).")
-
-    if match := pattern.search(comment):
+    if match := REFSEQ_COMMENT_PATTERN.search(comment):
         return match.group(1), match.group(2)
 
     raise ValueError("Invalid RefSeq comment")
@@ -31,7 +37,7 @@ def group_genbank_records_by_isolate(
             # Assume this is a monopartite OTU and do not group.
             continue
 
-        versioned_accession = Accession.from_string(record.accession_version)
+        versioned_accession = record.versioned_accession
         isolates[isolate_name][versioned_accession] = record
 
     return isolates
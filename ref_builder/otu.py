@@ -1,4 +1,5 @@
 from collections import Counter
+from collections.abc import Iterator
 from uuid import UUID
 
 import structlog
@@ -15,7 +16,7 @@ logger = structlog.get_logger()
 
 def assign_records_to_segments(
     records: list[NCBIGenbank], plan: Plan
-) -> dict[UUID, NCBIGenbank]:
+) -> Iterator[tuple[UUID, NCBIGenbank]]:
     """Assign genbank records segment IDs based on the passed plan.
 
     Assignment is based on segment naming. The function tries to normalize the segment
@@ -31,12 +32,13 @@ def assign_records_to_segments(
     * A segment name is required by the plan but not found in the records.
     * There are duplicate segment names in the records.1
 
-    The assigned segments are returned as a dictionary with segment IDs as records keyed
-    by segment IDs.
+    Validation happens when the function is called. The assignments are returned as a
+    lazy iterator of segment ID and record pairs so callers can consume them in a
+    single pass.
 
     :param records: A list of Genbank records.
     :param plan: A plan.
-    :return: A dictionary of segment IDs as keys and records as values.
+    :return: An iterator of segment ID and record pairs.
     """
     if len(records) < len(plan.required_segments):
         raise PlanValidationError(
@@ -44,9 +46,11 @@ def assign_records_to_segments(
             f"{len(records)} < {len(plan.required_segments)}"
         )
 
-    seen_segment_names = Counter(
+    record_segment_names = [
         extract_segment_name_from_record_with_plan(record, plan) for record in records
-    )
+    ]
+
+    seen_segment_names = Counter(record_segment_names)
 
     if seen_segment_names.total() > 1 and seen_segment_names[None]:
         raise PlanValidationError(
@@ -54,7 +58,7 @@ def assign_records_to_segments(
             "plans may have unnamed segments."
         )
 
-    unassigned_segments = {segment.name: segment for segment in plan.segments}
+    segments_by_name = plan.segments_by_name
 
     duplicate_segment_names = [
         segment_name for segment_name, count in seen_segment_names.items() if count > 1
@@ -71,7 +75,7 @@ def assign_records_to_segments(
     segment_names_not_in_plan = [
         segment_name
         for segment_name in seen_segment_names
-        if segment_name not in unassigned_segments
+        if segment_name not in segments_by_name
     ]
 
     if segment_names_not_in_plan:
@@ -92,9 +96,7 @@ def assign_records_to_segments(
             f"{segment_names_not_in_records}",
         )
 
-    return {
-        unassigned_segments[
-            extract_segment_name_from_record_with_plan(record, plan)
-        ].id: record
-        for record in records
-    }
+    return (
+        (segments_by_name[segment_name].id, record)
+        for segment_name, record in zip(record_segment_names, records, strict=True)
+    )
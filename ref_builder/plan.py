@@ -1,5 +1,5 @@
-import math
 from contextlib import suppress
+from uuid import uuid4
 
 from ref_builder.errors import PlanCreationError
 from ref_builder.models.plan import (
@@ -36,19 +36,13 @@ def extract_segment_name_from_record_with_plan(
         return segment_name
 
     if not plan.monopartite:
-        if any(segment.name is None for segment in plan.segments):
+        if None in plan.segments_by_name:
             raise ValueError("Multipartite plan contains unnamed segments")
 
-        plan_keys_and_prefixes = {
-            segment.name.key: segment.name.prefix
-            for segment in plan.segments
-            if segment.name is not None
-        }
-
         # Handle no prefix.
         with suppress(KeyError):
             return SegmentName(
-                prefix=plan_keys_and_prefixes[record.source.segment],
+                prefix=plan.segment_prefixes_by_key[record.source.segment],
                 key=record.source.segment,
             )
 
@@ -64,16 +58,7 @@ def create_plan_from_records(
     if len(records) == 1:
         record = records[0]
 
-        return Plan.new(
-            segments=[
-                Segment.new(
-                    length=len(record.sequence),
-                    length_tolerance=length_tolerance,
-                    name=extract_segment_name_from_record(record),
-                    rule=SegmentRule.REQUIRED,
-                )
-            ]
-        )
+        return _create_monopartite_plan_unchecked(record, length_tolerance)
 
     if len(group_genbank_records_by_isolate(records)) > 1:
         raise PlanCreationError("More than one isolate found. Cannot create plan.")
@@ -88,22 +73,28 @@ def create_plan_from_records(
     return Plan.new(segments=segments)
 
 
-def get_segments_min_length(segments: list[Segment]) -> int:
-    """Return the shortest minimum length from a list of segments."""
-    shortest_segment = min(segments, key=lambda s: s.length)
+def _create_monopartite_plan_unchecked(
+    record: NCBIGenbank, length_tolerance: float
+) -> Plan:
+    """Return a monopartite plan for ``record`` without running model validation.
 
-    return math.floor(
-        shortest_segment.length * (1.0 - shortest_segment.length_tolerance)
+    All values are derived from an already validated record, and a monopartite plan
+    always satisfies the plan naming rules.
+    """
+    return Plan.model_construct(
+        id=uuid4(),
+        segments=[
+            Segment.model_construct(
+                id=uuid4(),
+                length=len(record.sequence),
+                length_tolerance=length_tolerance,
+                name=extract_segment_name_from_record(record),
+                rule=SegmentRule.REQUIRED.value,
+            )
+        ],
     )
 
 
-def get_segments_max_length(segments: list[Segment]) -> int:
-    """Return the longest maximum length from a list of segments."""
-    longest_segment = max(segments, key=lambda s: s.length)
-
-    return math.ceil(longest_segment.length * (1.0 + longest_segment.length_tolerance))
-
-
 def create_segments_from_records(
     records: list[NCBIGenbank], rule: SegmentRule, length_tolerance: float
 ) -> list[Segment]:
@@ -22,30 +22,30 @@ def assign_segment_id_to_record(
     if segment_name is None and plan.monopartite:
         return plan.segments[0].id
 
-    for segment in plan.segments:
-        if segment_name == segment.name:
-            return segment.id
+    if (segment := plan.segments_by_name.get(segment_name)) is not None:
+        return segment.id
 
     return None
 
 
 def promote_otu_from_records(
     repo: Repo, otu: OTU, records: list[NCBIGenbank]
-) -> set[str]:
+) -> tuple[set[str], OTU]:
     """Promote GenBank sequences to their RefSeq equivalents.
 
     Takes a list of records, identifies RefSeq records that replace existing
     GenBank sequences in the OTU, and promotes them using the PromoteSequence event.
-    Returns the set of promoted accessions.
+    Returns the set of promoted accessions and the OTU as it is after promotion.
     """
     log = logger.bind(otu_id=str(otu.id), taxid=otu.taxid)
 
-    refseq_records = [record for record in records if record.refseq]
-
     # Group RefSeq records by the isolate they replace
     isolate_promotion_map = {}
 
-    for record in refseq_records:
+    for record in records:
+        if not record.refseq:
+            continue
+
         try:
             _, predecessor_accession = parse_refseq_comment(record.comment)
 
@@ -75,7 +75,7 @@ def promote_otu_from_records(
 
     if not isolate_promotion_map:
         log.info("No promotable sequences found.")
-        return set()
+        return set(), otu
 
     promoted_accessions = set()
 
@@ -140,17 +140,19 @@ def promote_otu_from_records(
             )
             continue
 
-        refreshed_otu = repo.get_otu(otu.id)
+    if not promoted_accessions:
+        return promoted_accessions, otu
 
-        if refreshed_otu is None:
-            raise ValueError(f"OTU does not exist: {otu.id}")
+    log.info(
+        "Sequences promoted.",
+        promoted_accessions=promoted_accessions,
+    )
 
-        otu = refreshed_otu
+    # Promoting an isolate does not change the plan or any other isolate, so the OTU
+    # only needs to be reloaded once all isolates have been promoted.
+    promoted_otu = repo.get_otu(otu.id)
 
-    if promoted_accessions:
-        log.info(
-            "Sequences promoted.",
-            promoted_accessions=sorted(promoted_accessions),
-        )
+    if promoted_otu is None:
+        raise ValueError(f"OTU does not exist: {otu.id}")
 
-    return promoted_accessions
+    return promoted_accessions, promoted_otu
@@ -12,7 +12,7 @@ import datetime
 import shutil
 import uuid
 import warnings
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Collection, Generator, Iterator
 from contextlib import contextmanager
 from pathlib import Path
@@ -60,7 +60,7 @@ from ref_builder.events.repo import (
     CreateRepoData,
 )
 from ref_builder.events.sequence import UpdateSequence, UpdateSequenceData
-from ref_builder.index import Index
+from ref_builder.index import Index, OTUTimestamps
 from ref_builder.lock import Lock
 from ref_builder.models.accession import Accession
 from ref_builder.models.isolate import Isolate, IsolateName
@@ -79,6 +79,9 @@ from ref_builder.warnings import OTUDeletedWarning
 
 GITIGNORE_CONTENTS = [".cache", "lock"]
 
+OTU_CACHE_SIZE = 32
+"""The maximum number of rehydrated OTUs kept in memory by a repository."""
+
 logger = get_logger("repo")
 
 
@@ -103,6 +106,13 @@ class Repo:
         self._lock = Lock(self.path)
         """A lock for the repository."""
 
+        self._otu_cache: OrderedDict[uuid.UUID, tuple[int, OTU]] = OrderedDict()
+        """Rehydrated OTUs keyed by ID, stored with the ID of their latest event.
+
+        A cached OTU is only used while its latest event ID matches the index. The
+        least recently used OTUs are evicted once ``OTU_CACHE_SIZE`` is exceeded.
+        """
+
         # Populate the index if it is empty, or migrate it if it lacks
         # tables/columns added after the index was first built.
         if not self._index.otu_ids or self._index.needs_rebuild:
@@ -193,6 +203,8 @@ class Repo:
 
     def clear_index(self) -> bool:
         """Delete and replace the repository read index."""
+        self._otu_cache.clear()
+
         index_path = self._index.path
 
         if index_path.exists():
@@ -212,16 +224,19 @@ class Repo:
             path=str(self.path),
         )
 
+        self._otu_cache.clear()
+
         for otu in self.iter_otus_from_events():
             self._index.upsert_otu(otu, self.last_id)
 
-        for event in self._event_store.iter_events():
-            try:
-                otu_id = event.query.model_dump()["otu_id"]
-            except KeyError:
-                continue
+        with self._index.transaction():
+            for event in self._event_store.iter_events():
+                try:
+                    otu_id = event.query.model_dump()["otu_id"]
+                except KeyError:
+                    continue
 
-            self._index.add_event_id(event.id, otu_id, event.timestamp)
+                self._index.add_event_id(event.id, otu_id, event.timestamp)
 
     def iter_minimal_otus(self) -> Iterator[OTUMinimal]:
         """Iterate over minimal representations of the OTUs in the repository.
@@ -231,9 +246,13 @@ class Repo:
         return self._index.iter_minimal_otus()
 
     def iter_otus(self) -> Iterator[OTU]:
-        """Iterate over the OTUs in the repository."""
+        """Iterate over the OTUs in the repository.
+
+        OTUs read during iteration are not added to the OTU cache, so memory use does
+        not grow with the size of the repository.
+        """
         for otu_id in self._index.otu_ids:
-            if (otu := self.get_otu(otu_id)) is not None:
+            if (otu := self._load_otu(otu_id, cache=False)) is not None:
                 yield otu
 
     def iter_otus_from_events(self) -> Iterator[OTU]:
@@ -356,7 +375,7 @@ class Repo:
                 msg = f"OTU {otu.id} already contains taxid {taxon.id} ({taxon.name})"
                 raise ValueError(msg)
 
-        self._check_accessions_unused(
+        self.check_accessions_unused(
             None,
             {sequence.accession.key for sequence in isolate.sequences},
         )
@@ -399,7 +418,7 @@ class Repo:
         :param sequences: list of SequenceData objects
         :return: the created isolate
         """
-        self._check_accessions_unused(
+        self.check_accessions_unused(
             otu_id,
             {sequence.accession.key for sequence in sequences},
         )
@@ -486,7 +505,7 @@ class Repo:
             for new_sequence in accession_map.values()
             if new_sequence.accession.key not in existing_keys
         }
-        self._check_accessions_unused(otu_id, new_keys)
+        self.check_accessions_unused(otu_id, new_keys)
 
         self._write_event(
             PromoteIsolate,
@@ -507,7 +526,7 @@ class Repo:
         exclude accessions since the accession key remains the same.
         """
         if new_sequence.accession.key != old_accession.key:
-            self._check_accessions_unused(otu_id, {new_sequence.accession.key})
+            self.check_accessions_unused(otu_id, {new_sequence.accession.key})
 
         self._write_event(
             UpdateSequence,
@@ -536,7 +555,7 @@ class Repo:
         accessions: Collection[str],
     ) -> set[str]:
         """Add accessions to OTU's excluded accessions."""
-        otu = self.get_otu(otu_id)
+        otu = self._load_otu(otu_id)
 
         if otu is None:
             raise ValueError(f"OTU does not exist: {otu_id}")
@@ -553,7 +572,7 @@ class Repo:
                     accessions=sorted(accessions),
                 )
 
-                return otu.excluded_accessions
+                return set(otu.excluded_accessions)
 
             raise
 
@@ -563,8 +582,8 @@ class Repo:
         ):
             logger.info(
                 "Ignoring already excluded accessions",
-                requested_exclusions=sorted(extant_requested_accessions),
-                old_excluded_accessions=sorted(otu.excluded_accessions),
+                requested_exclusions=extant_requested_accessions,
+                old_excluded_accessions=otu.excluded_accessions,
             )
 
             excludable_accessions -= otu.excluded_accessions
@@ -583,18 +602,13 @@ class Repo:
                 "Added accessions to excluded accession list.",
                 taxid=otu.taxid,
                 otu_id=str(otu.id),
-                new_excluded_accessions=sorted(excludable_accessions),
-                old_excluded_accessions=sorted(otu.excluded_accessions),
+                new_excluded_accessions=excludable_accessions,
+                old_excluded_accessions=otu.excluded_accessions,
             )
         else:
             logger.warning("No excludable accessions were given.")
 
-        updated_otu = self.get_otu(otu_id)
-
-        if updated_otu is None:
-            raise ValueError(f"OTU does not exist: {otu_id}")
-
-        return updated_otu.excluded_accessions
+        return otu.excluded_accessions | excludable_accessions
 
     def allow_accessions(
         self,
@@ -602,7 +616,7 @@ class Repo:
         accessions: Collection[str],
     ) -> set[str]:
         """Remove accessions from OTU's excluded accessions."""
-        otu = self.get_otu(otu_id)
+        otu = self._load_otu(otu_id)
 
         if otu is None:
             raise ValueError(f"OTU does not exist: {otu_id}")
@@ -612,7 +626,7 @@ class Repo:
         if redundant_accessions := allowable_accessions - otu.excluded_accessions:
             logger.debug(
                 "Ignoring non-excluded accessions",
-                non_excluded_accessions=sorted(redundant_accessions),
+                non_excluded_accessions=redundant_accessions,
             )
 
             allowable_accessions = allowable_accessions - redundant_accessions
@@ -631,15 +645,10 @@ class Repo:
                 "Removed accessions from excluded accession list.",
                 taxid=otu.taxid,
                 otu_id=str(otu.id),
-                new_excluded_accessions=sorted(allowable_accessions),
+                new_excluded_accessions=allowable_accessions,
             )
 
-        updated_otu = self.get_otu(otu_id)
-
-        if updated_otu is None:
-            raise ValueError(f"OTU does not exist: {otu_id}")
-
-        return updated_otu.excluded_accessions
+        return otu.excluded_accessions - allowable_accessions
 
     def get_otu_id_by_isolate_id(self, isolate_id: uuid.UUID) -> uuid.UUID | None:
         """Get an OTU ID from an isolate ID that belongs to it."""
@@ -657,7 +666,7 @@ class Repo:
         """All accession keys (unversioned) currently stored across every OTU."""
         return {key for key, _ in self._index.iter_accession_keys()}
 
-    def _check_accessions_unused(
+    def check_accessions_unused(
         self,
         otu_id: uuid.UUID | None,
         accession_keys: Collection[str],
@@ -669,9 +678,10 @@ class Repo:
         """
         conflicts: dict[uuid.UUID, set[str]] = defaultdict(set)
 
-        for key in accession_keys:
-            existing_owner = self._index.get_otu_id_by_accession_key(key)
-            if existing_owner is not None and existing_owner != otu_id:
+        for key, existing_owner in self._index.get_otu_ids_by_accession_keys(
+            accession_keys
+        ).items():
+            if existing_owner != otu_id:
                 conflicts[existing_owner].add(key)
 
         if conflicts:
@@ -682,15 +692,58 @@ class Repo:
 
         If the OTU does not exist, ``None`` is returned.
 
+        OTUs are only rehydrated from their events when new events have been written
+        since the OTU was last retrieved. A copy is returned so callers can safely
+        mutate it.
+
         :param otu_id: the id of the OTU
         :return: the OTU or ``None``
 
+        """
+        if (otu := self._load_otu(otu_id)) is None:
+            return None
+
+        return otu.model_copy(deep=True)
+
+    def get_excluded_accessions(self, otu_id: uuid.UUID) -> set[str] | None:
+        """Get the excluded accessions of the OTU with the given ``otu_id``.
+
+        This avoids copying the whole OTU when only its exclusions are needed.
+
+        :param otu_id: the id of the OTU
+        :return: the excluded accession keys or ``None`` if the OTU does not exist
+        """
+        if (otu := self._load_otu(otu_id)) is None:
+            return None
+
+        return set(otu.excluded_accessions)
+
+    def _load_otu(self, otu_id: uuid.UUID, *, cache: bool = True) -> OTU | None:
+        """Return the cached OTU state for ``otu_id``, rehydrating it if stale.
+
+        By default, the returned OTU is shared with the cache and must not be mutated.
+        If ``cache`` is ``False``, a rehydrated OTU is not added to the cache and the
+        returned OTU is never shared.
         """
         event_index_item = self._index.get_event_ids_by_otu_id(otu_id)
 
         if event_index_item is None:
+            self._otu_cache.pop(otu_id, None)
             return None
 
+        latest_event_id = event_index_item.event_ids[-1]
+
+        if (cached := self._otu_cache.get(otu_id)) is not None:
+            cached_event_id, cached_otu = cached
+
+            if cached_event_id == latest_event_id:
+                if not cache:
+                    return cached_otu.model_copy(deep=True)
+
+                self._otu_cache.move_to_end(otu_id)
+
+                return cached_otu
+
         try:
             events = (
                 self._event_store.read_event(event_id)
@@ -717,8 +770,21 @@ class Repo:
 
         self._index.upsert_otu(otu, self.last_id)
 
+        if cache:
+            self._cache_otu(latest_event_id, otu)
+
         return otu
 
+    def _cache_otu(self, event_id: int, otu: OTU) -> None:
+        """Cache ``otu`` as the state at ``event_id``, evicting the least recently used
+        OTU if the cache is full.
+        """
+        self._otu_cache[otu.id] = (event_id, otu)
+        self._otu_cache.move_to_end(otu.id)
+
+        if len(self._otu_cache) > OTU_CACHE_SIZE:
+            self._otu_cache.popitem(last=False)
+
     def iter_otu_events(self, otu_id: uuid.UUID) -> Generator[Event]:
         """Iterate through event log."""
         event_index_item = self._index.get_event_ids_by_otu_id(otu_id)
@@ -756,6 +822,16 @@ class Repo:
         """
         return self._index.get_id_by_taxid(taxid)
 
+    def get_otu_ids_by_taxids(self, taxids: Collection[int]) -> dict[int, uuid.UUID]:
+        """Return the UUIDs of the OTUs with the given ``taxids``.
+
+        Taxonomy IDs without an OTU are omitted from the returned dictionary.
+
+        :param taxids: the taxonomy IDs of the OTUs
+        :return: a dictionary of OTU UUIDs keyed by taxonomy ID
+        """
+        return self._index.get_ids_by_taxids(taxids)
+
     def get_isolate(self, isolate_id: uuid.UUID) -> Isolate | None:
         """Return the isolate with the given id if it exists, else None."""
         if otu_id := self.get_otu_id_by_isolate_id(isolate_id):
@@ -780,20 +856,40 @@ class Repo:
         """
         return self._index.get_latest_timestamp_by_otu_id(otu_id)
 
+    def get_otu_timestamps(self) -> dict[uuid.UUID, OTUTimestamps]:
+        """Get the creation, modification, and update timestamps of every OTU.
+
+        This is more performant than calling ``get_otu_first_created``,
+        ``get_otu_last_modified``, and ``get_otu_last_updated`` for each OTU.
+        """
+        return self._index.get_otu_timestamps()
+
     def get_otu_last_updated(self, otu_id: uuid.UUID) -> datetime.datetime | None:
         """Get the timestamp of the last time this OTU was automatically updated.
         If this OTU has not been updated since this repo was initialized, return None.
         """
         return self._index.get_last_otu_update_timestamp(otu_id)
 
-    def write_otu_update_history_entry(self, otu_id: uuid.UUID) -> int:
+    def get_otu_unused_accessions(self) -> dict[uuid.UUID, set[str]]:
+        """Get the accession keys that the last update of each OTU fetched but could
+        not add to it.
+        """
+        return self._index.get_unused_accession_keys()
+
+    def write_otu_update_history_entry(
+        self, otu_id: uuid.UUID, *, unused_accessions: Collection[str] = ()
+    ) -> int:
         """Add a new entry to the otu update history log and return the primary key
         of the entry.
+
+        ``unused_accessions`` are accession keys that were fetched in the update but
+        could not be added to the OTU, so they can be fetched again in the next update.
         """
         if (
             update_id := self._index.add_otu_update_history_entry(
                 otu_id,
                 arrow.utcnow().naive,
+                unused_accession_keys=unused_accessions,
             )
             is None
         ):
@@ -833,13 +929,16 @@ class Repo:
 
                 otu = event.apply(otu)
 
-        for warning_msg in warning_list:
-            logger.warning(
-                warning_msg.message,
-                otu_id=str(otu.id),
-                warning_category=warning_msg.category.__name__,
-            )
+        _log_otu_warnings(otu.id, warning_list)
 
+        return Repo._finalize_otu(otu)
+
+    @staticmethod
+    def _finalize_otu(otu: OTU) -> OTU:
+        """Sort the isolates and sequences of an OTU and revalidate it.
+
+        Validating rebuilds the OTU lookup dictionaries after event mutations.
+        """
         otu.isolates.sort(
             key=lambda i: (
                 f"{i.name.type} {i.name.value}" if type(i.name) is IsolateName else ""
@@ -849,7 +948,6 @@ class Repo:
         for isolate in otu.isolates:
             isolate.sequences.sort(key=lambda s: s.accession)
 
-        # Validate to rebuild OTU lookup dictionaries after all mutations
         return OTU.model_validate(otu)
 
     def _write_event(
@@ -875,46 +973,89 @@ class Repo:
             timestamp=arrow.utcnow().naive,
         )
 
+        # The resulting OTU state, if the event could be applied in-memory.
+        applied_otu = None
+
         # Validate OTU events by applying in-memory
         if hasattr(event.query, "otu_id"):
-            if isinstance(event, CreateOTU):
-                try:
-                    otu = event.apply()
-                    otu = OTU.model_validate(otu)
-                except Exception as e:
-                    msg = f"Event validation failed: {e}"
-                    raise ValueError(msg) from e
-            else:
-                # Get current OTU state
-                otu = self.get_otu(event.query.otu_id)
-
-                if otu is None:
-                    msg = f"Cannot apply event to non-existent OTU {event.query.otu_id}"
-                    raise ValueError(msg)
-
-                # Apply event to validate it produces valid state
-                if isinstance(event, ApplicableEvent):
+            with warnings.catch_warnings(record=True) as warning_list:
+                if isinstance(event, CreateOTU):
                     try:
-                        otu = event.apply(otu)
-                        otu = OTU.model_validate(otu)
+                        applied_otu = self._finalize_otu(event.apply())
                     except Exception as e:
                         msg = f"Event validation failed: {e}"
                         raise ValueError(msg) from e
+                else:
+                    # Get current OTU state
+                    otu = self.get_otu(event.query.otu_id)
+
+                    if otu is None:
+                        msg = (
+                            "Cannot apply event to non-existent OTU "
+                            f"{event.query.otu_id}"
+                        )
+                        raise ValueError(msg)
+
+                    # Apply event to validate it produces valid state
+                    if isinstance(event, ApplicableEvent):
+                        try:
+                            applied_otu = self._finalize_otu(event.apply(otu))
+                        except Exception as e:
+                            msg = f"Event validation failed: {e}"
+                            raise ValueError(msg) from e
+
+            _log_otu_warnings(event.query.otu_id, warning_list)
+            _reissue_warnings(warning_list)
 
         # Validation passed - write to disk
         written_event = self._event_store.write_event(event)
 
-        # Update index
-        if hasattr(event.query, "otu_id"):
-            self._index.add_event_id(
-                written_event.id,
-                event.query.otu_id,
-                written_event.timestamp,
-            )
+        # Update index. The event ID and OTU state are committed together.
+        with self._index.transaction():
+            if hasattr(event.query, "otu_id"):
+                self._index.add_event_id(
+                    written_event.id,
+                    event.query.otu_id,
+                    written_event.timestamp,
+                )
+
+            # Keep the index current with the state validated above, so the next read
+            # of this OTU does not need to replay its events.
+            if applied_otu is not None:
+                self._index.upsert_otu(applied_otu, written_event.id)
+
+        if applied_otu is not None:
+            self._cache_otu(written_event.id, applied_otu)
 
         return written_event
 
 
+def _log_otu_warnings(
+    otu_id: uuid.UUID, warning_list: list[warnings.WarningMessage]
+) -> None:
+    """Log warnings captured while applying events to an OTU."""
+    for warning_msg in warning_list:
+        logger.warning(
+            warning_msg.message,
+            otu_id=str(otu_id),
+            warning_category=warning_msg.category.__name__,
+        )
+
+
+def _reissue_warnings(warning_list: list[warnings.WarningMessage]) -> None:
+    """Issue captured warnings again, so they reach the caller as if they had not
+    been captured.
+    """
+    for warning_msg in warning_list:
+        warnings.warn_explicit(
+            warning_msg.message,
+            warning_msg.category,
+            warning_msg.filename,
+            warning_msg.lineno,
+            source=warning_msg.source,
+        )
+
+
 @contextmanager
 def locked_repo(path: Path) -> Generator[Repo]:
     """Yield a locked Repo."""
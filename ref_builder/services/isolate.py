@@ -5,7 +5,6 @@ from uuid import UUID, uuid4
 import structlog
 
 from ref_builder.errors import PlanValidationError
-from ref_builder.models.accession import Accession
 from ref_builder.models.isolate import Isolate, IsolateName
 from ref_builder.models.otu import OTU
 from ref_builder.models.sequence import Sequence
@@ -51,15 +50,15 @@ class IsolateService(Service):
             return None
 
         # Extract taxid from records
-        taxids = {record.source.taxid for record in fetched_records}
-        if len(taxids) > 1:
+        taxid = fetched_records[0].source.taxid
+
+        if any(record.source.taxid != taxid for record in fetched_records):
             log.error(
                 "Not all records have the same taxid.",
-                taxids=sorted(taxids),
+                taxids=sorted({record.source.taxid for record in fetched_records}),
             )
             return None
 
-        taxid = fetched_records[0].source.taxid
         log = log.bind(taxid=taxid)
 
         # Find OTU by taxid
@@ -72,9 +71,12 @@ class IsolateService(Service):
         log = log.bind(otu_id=str(otu.id), otu_name=otu.name)
 
         # Filter out blocked accessions (per-OTU and anywhere else in the repo).
-        eligible_accessions = filter_accessions(
-            [r.accession for r in fetched_records],
-            otu.blocked_accessions | self._repo.accession_keys,
+        eligible_accessions = frozenset(
+            filter_accessions(
+                (record.accession for record in fetched_records),
+                otu.blocked_accessions,
+                self._repo.accession_keys,
+            )
         )
 
         if not eligible_accessions:
@@ -104,15 +106,11 @@ class IsolateService(Service):
         if all(record.refseq for record in records):
             log.info("Checking for promotable sequences")
 
-            promoted_accessions = promote_otu_from_records(self._repo, otu, records)
+            promoted_accessions, otu = promote_otu_from_records(
+                self._repo, otu, records
+            )
 
             if promoted_accessions:
-                otu = self._repo.get_otu(otu.id)
-
-                if otu is None:
-                    log.error("OTU disappeared after promotion")
-                    return None
-
                 # Find the isolate by one of the promoted accessions
                 promoted_accession = next(iter(promoted_accessions))
                 isolate = otu.get_isolate_by_accession(promoted_accession)
@@ -120,7 +118,7 @@ class IsolateService(Service):
                 if isolate:
                     log.info(
                         "Sequences promoted",
-                        promoted_accessions=sorted(promoted_accessions),
+                        promoted_accessions=promoted_accessions,
                     )
                     return isolate
 
@@ -224,16 +222,15 @@ class IsolateService(Service):
         )
 
         # Validate all records have the same taxid
-        taxids = {record.source.taxid for record in records}
-        if len(taxids) > 1:
+        taxid = records[0].source.taxid
+
+        if any(record.source.taxid != taxid for record in records):
             log.error(
                 "Not all records have the same taxid.",
-                taxids=sorted(taxids),
+                taxids=sorted({record.source.taxid for record in records}),
             )
             return None
 
-        taxid = records[0].source.taxid
-
         try:
             assigned = assign_records_to_segments(records, otu.plan)
         except PlanValidationError as e:
@@ -246,15 +243,21 @@ class IsolateService(Service):
 
         isolate_id = uuid4()
 
-        sequences = [
-            Sequence(
-                accession=Accession.from_string(record.accession_version),
-                definition=record.definition,
-                segment=segment_id,
-                sequence=record.sequence,
+        sequences = []
+        old_accessions = []
+
+        for segment_id, record in assigned:
+            sequences.append(
+                Sequence(
+                    accession=record.versioned_accession,
+                    definition=record.definition,
+                    segment=segment_id,
+                    sequence=record.sequence,
+                )
             )
-            for segment_id, record in assigned.items()
-        ]
+
+            if record.refseq:
+                old_accessions.append(parse_refseq_comment(record.comment)[1])
 
         isolate = self._repo.create_isolate(
             otu_id=otu.id,
@@ -264,14 +267,8 @@ class IsolateService(Service):
             sequences=sequences,
         )
 
-        for record in assigned.values():
-            if record.refseq:
-                _, old_accession = parse_refseq_comment(record.comment)
-
-                self._repo.exclude_accessions(
-                    otu.id,
-                    [old_accession],
-                )
+        if old_accessions:
+            self._repo.exclude_accessions(otu.id, old_accessions)
 
         log.info("Isolate created", id=str(isolate_id))
 
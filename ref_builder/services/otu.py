@@ -17,11 +17,7 @@ from ref_builder.ncbi.utils import (
     parse_refseq_comment,
 )
 from ref_builder.otu import assign_records_to_segments
-from ref_builder.plan import (
-    create_plan_from_records,
-    get_segments_max_length,
-    get_segments_min_length,
-)
+from ref_builder.plan import create_plan_from_records
 from ref_builder.promote import (
     assign_segment_id_to_record,
     promote_otu_from_records,
@@ -32,6 +28,9 @@ logger = structlog.get_logger("services.otu")
 
 UUID_STRING_LENGTH = 36
 
+UUID_HYPHEN_INDEXES = (8, 13, 18, 23)
+"""The positions of the hyphens in a canonical UUID string."""
+
 
 class OTUService(Service):
     """Service for managing OTU operations."""
@@ -46,19 +45,16 @@ class OTUService(Service):
         """
         otu_id = None
 
-        if len(identifier) == UUID_STRING_LENGTH:
+        if len(identifier) == UUID_STRING_LENGTH and all(
+            identifier[index] == "-" for index in UUID_HYPHEN_INDEXES
+        ):
             try:
                 otu_id = UUID(identifier)
             except ValueError:
                 otu_id = None
 
-        elif identifier.isnumeric():
-            try:
-                taxid = int(identifier)
-            except ValueError:
-                pass
-            else:
-                otu_id = self._repo.get_otu_id_by_taxid(taxid)
+        elif identifier.isdecimal():
+            otu_id = self._repo.get_otu_id_by_taxid(int(identifier))
 
         if otu_id is None:
             return None
@@ -74,27 +70,40 @@ class OTUService(Service):
         Uses the provided accessions to generate a plan and add a first isolate.
         Derives the taxonomy ID from the accessions.
 
+        Duplicate accessions are dropped. Accessions that already belong to an OTU
+        in the repo are rejected before any records are fetched.
+
         :param accessions: accessions to build the new OTU from
         :return: the created OTU or None if creation failed
         """
+        accessions = list(
+            dict.fromkeys(
+                stripped for accession in accessions if (stripped := accession.strip())
+            )
+        )
+
         log = logger.bind(accessions=accessions)
 
         if not accessions:
             log.error("OTU could not be created to spec based on given data.")
             return None
 
+        self._repo.check_accessions_unused(
+            None, {accession.partition(".")[0] for accession in accessions}
+        )
+
         records = self.ncbi.fetch_genbank_records(accessions)
 
         if len(records) != len(accessions):
             log.fatal("Could not retrieve all requested accessions.")
             return None
 
-        if len({record.source.taxid for record in records}) > 1:
+        taxid = records[0].source.taxid
+
+        if any(record.source.taxid != taxid for record in records):
             log.fatal("Not all records are from the same organism.")
             return None
 
-        taxid = records[0].source.taxid
-
         binned_records = group_genbank_records_by_isolate(records)
 
         if len(binned_records) > 1:
@@ -154,23 +163,23 @@ class OTUService(Service):
         isolate_id = uuid4()
 
         if plan.monopartite:
-            record = records[0]
-            assigned = {plan.segments[0].id: record}
+            assigned = iter([(plan.segments[0].id, records[0])])
         else:
             assigned = assign_records_to_segments(records, plan)
 
-        sequences = [
-            Sequence(
-                accession=Accession.from_string(record.accession_version),
-                definition=record.definition,
-                segment=segment_id,
-                sequence=record.sequence,
+        sequences = []
+        promoted_accessions = set()
+
+        for segment_id, record in assigned:
+            sequences.append(
+                Sequence(
+                    accession=record.versioned_accession,
+                    definition=record.definition,
+                    segment=segment_id,
+                    sequence=record.sequence,
+                )
             )
-            for segment_id, record in assigned.items()
-        ]
 
-        promoted_accessions = set()
-        for record in assigned.values():
             if record.refseq:
                 _, old_accession = parse_refseq_comment(record.comment)
                 promoted_accessions.add(old_accession)
@@ -206,16 +215,14 @@ class OTUService(Service):
         :param otu_id: the OTU ID
         :param accessions: accessions to exclude
         """
-        otu = self._repo.get_otu(otu_id)
+        original_excluded_accessions = self._repo.get_excluded_accessions(otu_id)
 
-        if otu is None:
+        if original_excluded_accessions is None:
             logger.error("OTU not found", otu_id=str(otu_id))
             return
 
-        original_excluded_accessions = otu.excluded_accessions.copy()
-
         excluded_accessions = self._repo.exclude_accessions(
-            otu_id=otu.id, accessions=accessions
+            otu_id=otu_id, accessions=accessions
         )
 
         if excluded_accessions == original_excluded_accessions:
@@ -226,8 +233,8 @@ class OTUService(Service):
         else:
             logger.info(
                 "Updated excluded accession list.",
-                otu_id=str(otu.id),
-                excluded_accessions=sorted(excluded_accessions),
+                otu_id=str(otu_id),
+                excluded_accessions=excluded_accessions,
             )
 
     def allow_accessions(
@@ -242,16 +249,14 @@ class OTUService(Service):
         :param otu_id: the OTU ID
         :param accessions: accessions to allow
         """
-        otu = self._repo.get_otu(otu_id)
+        original_excluded_accessions = self._repo.get_excluded_accessions(otu_id)
 
-        if otu is None:
+        if original_excluded_accessions is None:
             logger.error("OTU not found", otu_id=str(otu_id))
             return
 
-        original_excluded_accessions = otu.excluded_accessions.copy()
-
         excluded_accessions = self._repo.allow_accessions(
-            otu_id=otu.id, accessions=accessions
+            otu_id=otu_id, accessions=accessions
         )
 
         if excluded_accessions == original_excluded_accessions:
@@ -262,48 +267,80 @@ class OTUService(Service):
         else:
             logger.info(
                 "Updated excluded accession list.",
-                otu_id=str(otu.id),
-                excluded_accessions=sorted(excluded_accessions),
+                otu_id=str(otu_id),
+                excluded_accessions=excluded_accessions,
             )
 
-    def _promote_accessions(self, otu: OTU) -> set[str]:
-        """Fetch new accessions from NCBI Nucleotide and promote accessions
-        with newly added RefSeq equivalents.
-
-        :param otu: the OTU builder instance
-        :return: set of promoted accession keys
-        """
-        log = logger.bind(otu_id=otu.id, taxid=otu.taxid)
+    def _collect_update_inputs(
+        self, otu: OTU
+    ) -> tuple[list[Accession], dict[str, NCBIGenbank]]:
+        """Fetch the accessions and records needed to update an OTU.
 
-        log.info("Checking for promotable sequences.")
+        NCBI Nucleotide is searched once for accessions associated with the OTU taxid.
+        Records for unblocked accessions and upgradable sequences are then fetched in a
+        single batch and shared by the promotion, upgrade, and new isolate steps.
 
+        :param otu: the OTU to update
+        :return: the server accessions and the fetched records keyed by accession key
+        """
         accessions = self.ncbi.fetch_accessions_by_taxid(
             otu.taxid,
-            sequence_min_length=get_segments_min_length(otu.plan.segments),
-            sequence_max_length=get_segments_max_length(otu.plan.segments),
-            refseq_only=True,
+            sequence_min_length=otu.plan.min_segment_length,
+            sequence_max_length=otu.plan.max_segment_length,
         )
 
-        fetch_set = (
-            {accession.key for accession in accessions}
-            - otu.blocked_accessions
-            - self._repo.accession_keys
+        blocked_accessions = otu.blocked_accessions
+        repo_accession_keys = self._repo.accession_keys
+
+        fetch_list = [
+            accession.key
+            for accession in accessions
+            if accession.key not in blocked_accessions
+            and accession.key not in repo_accession_keys
+        ]
+
+        fetch_list.extend(
+            str(accession) for accession in _get_upgradable_accessions(otu, accessions)
         )
 
-        if fetch_set:
-            records = self.ncbi.fetch_genbank_records(fetch_set)
+        if not fetch_list:
+            return accessions, {}
+
+        records = self.ncbi.fetch_genbank_records(fetch_list)
+
+        return accessions, {record.accession: record for record in records}
+
+    def _promote_accessions(
+        self, otu: OTU, records: dict[str, NCBIGenbank]
+    ) -> set[str]:
+        """Promote accessions with newly added RefSeq equivalents.
 
+        :param otu: the OTU to promote sequences in
+        :param records: fetched records keyed by accession key
+        :return: set of promoted accession keys
+        """
+        log = logger.bind(otu_id=otu.id, taxid=otu.taxid)
+
+        log.info("Checking for promotable sequences.")
+
+        refseq_records = [
+            record
+            for record in records.values()
+            if record.refseq and record.accession not in otu.accessions
+        ]
+
+        if refseq_records:
             log.debug(
                 "New accessions found. Checking for promotable records.",
-                fetch_list=sorted(fetch_set),
+                fetch_list=[record.accession for record in refseq_records],
             )
 
-            if promoted_accessions := promote_otu_from_records(
-                self._repo, otu, records
-            ):
-                log.info(
-                    "Sequences promoted.", new_accessions=sorted(promoted_accessions)
-                )
+            promoted_accessions, _ = promote_otu_from_records(
+                self._repo, otu, refseq_records
+            )
+
+            if promoted_accessions:
+                log.info("Sequences promoted.", new_accessions=promoted_accessions)
 
                 return promoted_accessions
 
@@ -314,55 +351,42 @@ class OTUService(Service):
     def _upgrade_outdated_sequences(
         self,
         otu: OTU,
+        accessions: list[Accession],
+        records: dict[str, NCBIGenbank],
     ) -> set[str]:
-        """Fetch all extant accessions in the OTU and check if the record has been
-        modified since last addition. Replace the sequence if an upgrade is found.
-        """
-        all_server_accessions = self.ncbi.fetch_accessions_by_taxid(
-            otu.taxid,
-            sequence_min_length=get_segments_min_length(otu.plan.segments),
-            sequence_max_length=get_segments_max_length(otu.plan.segments),
-        )
+        """Check if extant sequences in the OTU have been modified since they were
+        added. Replace the sequence if an upgrade is found.
 
-        server_upgraded_accessions = {
-            accession for accession in all_server_accessions if accession.version > 2
-        }
-
-        replacement_index = {}
-
-        for accession in server_upgraded_accessions:
-            if (
-                accession.key in otu.accessions
-                and accession not in otu.versioned_accessions
-            ):
-                replacement_index[accession] = otu.get_sequence(accession.key)
+        :param otu: the OTU to upgrade sequences in
+        :param accessions: the accessions found on NCBI for the OTU
+        :param records: fetched records keyed by accession key
+        :return: set of upgraded accession keys
+        """
+        upgradable_accessions = _get_upgradable_accessions(otu, accessions)
 
-        if not replacement_index:
+        if not upgradable_accessions:
             logger.info("All sequences are up to date.")
             return set()
 
         logger.info(
-            "Upgradable sequences found. Fetching records...",
-            upgradable_accessions=[str(accession) for accession in replacement_index],
-        )
-
-        records = self.ncbi.fetch_genbank_records(
-            [str(accession) for accession in replacement_index]
+            "Upgradable sequences found.",
+            upgradable_accessions=[
+                str(accession) for accession in upgradable_accessions
+            ],
         )
 
         upgraded_accessions = set()
 
-        for record in records:
-            outdated_sequence = otu.get_sequence(record.accession)
+        # Each upgrade only replaces the sequence for its own accession key, so ``otu``
+        # does not need to be reloaded between upgrades.
+        for accession, outdated_sequence in upgradable_accessions.items():
+            record = records.get(accession.key)
 
-            if outdated_sequence is None:
-                logger.error(
-                    "Outdated sequence not found in OTU",
-                    accession=record.accession,
-                )
+            if record is None:
+                logger.error("Upgraded record not fetched", accession=str(accession))
                 continue
 
-            versioned_accession = Accession.from_string(record.accession_version)
+            versioned_accession = record.versioned_accession
 
             segment_id = assign_segment_id_to_record(record, otu.plan)
             if segment_id is None:
@@ -374,7 +398,7 @@ class OTUService(Service):
 
             if versioned_accession not in otu.versioned_accessions:
                 new_sequence = Sequence(
-                    accession=Accession.from_string(record.accession_version),
+                    accession=versioned_accession,
                     definition=record.definition,
                     segment=segment_id,
                     sequence=record.sequence,
@@ -407,19 +431,11 @@ class OTUService(Service):
                     old_accession=outdated_sequence.accession,
                     new_accession=record.accession_version,
                 )
-                continue
-
-            refreshed_otu = self._repo.get_otu(otu.id)
-
-            if refreshed_otu is None:
-                raise ValueError(f"OTU does not exist: {otu.id}")
-
-            otu = refreshed_otu
 
         if upgraded_accessions:
             logger.info(
                 "Replaced sequences",
-                upgraded_accessions=sorted(upgraded_accessions),
+                upgraded_accessions=upgraded_accessions,
             )
 
         return upgraded_accessions
@@ -445,8 +461,10 @@ class OTUService(Service):
 
         log.info("Starting comprehensive OTU update.")
 
+        accessions, records = self._collect_update_inputs(otu)
+
         # Step 1: Promote GenBank accessions to RefSeq
-        if self._promote_accessions(otu):
+        if self._promote_accessions(otu, records):
             otu = self._repo.get_otu(otu.id)
 
             if otu is None:
@@ -454,7 +472,7 @@ class OTUService(Service):
                 return None
 
         # Step 2: Upgrade outdated sequence versions
-        upgraded_accessions = self._upgrade_outdated_sequences(otu)
+        upgraded_accessions = self._upgrade_outdated_sequences(otu, accessions, records)
 
         if upgraded_accessions:
             log.info("Upgraded sequences", count=len(upgraded_accessions))
@@ -465,69 +483,40 @@ class OTUService(Service):
                 return None
 
         # Step 3: Add new isolates
-        accessions = self.ncbi.fetch_accessions_by_taxid(
-            otu.taxid,
-            sequence_min_length=get_segments_min_length(otu.plan.segments),
-            sequence_max_length=get_segments_max_length(otu.plan.segments),
-        )
+        blocked_accessions = otu.blocked_accessions
+        repo_accession_keys = self._repo.accession_keys
+
+        new_records = [
+            record
+            for accession_key, record in records.items()
+            if accession_key not in blocked_accessions
+            and accession_key not in repo_accession_keys
+        ]
 
-        fetch_set = (
-            {accession.key for accession in accessions}
-            - otu.blocked_accessions
-            - self._repo.accession_keys
-        )
+        if new_records:
+            log.info("Adding new isolates from NCBI.", count=len(new_records))
 
-        if fetch_set:
-            log.info("Adding new isolates from NCBI.")
-            log.info(
-                "Fetching records.",
-                count=len(fetch_set),
-                fetch_list=sorted(fetch_set),
-            )
+            # Create isolates
+            new_isolate_ids = []
 
-            records = self.ncbi.fetch_genbank_records(fetch_set)
-
-            if records:
-                refseq_records = [r for r in records if r.refseq]
-                promoted_accessions = set()
-                if refseq_records:
-                    promoted_accessions = promote_otu_from_records(
-                        self._repo, otu, refseq_records
+            for isolate_name, isolate_records in group_genbank_records_by_isolate(
+                new_records
+            ).items():
+                try:
+                    isolate = self._services.isolate.create_from_records(
+                        otu.id, isolate_name, list(isolate_records.values())
+                    )
+                    if isolate:
+                        new_isolate_ids.append(isolate.id)
+                except ValueError as e:
+                    log.error(
+                        "Error creating isolate",
+                        error=str(e),
+                        isolate_name=isolate_name,
                     )
-                    if promoted_accessions:
-                        otu = self._repo.get_otu(otu.id)
-
-                        if otu is None:
-                            log.error("OTU disappeared after record promotion")
-                            return None
-
-                records = [
-                    r
-                    for r in records
-                    if r.accession.split(".")[0] not in promoted_accessions
-                ]
-
-                # Create isolates
-                new_isolate_ids = []
-
-                for isolate_name, isolate_records in group_genbank_records_by_isolate(
-                    records
-                ).items():
-                    try:
-                        isolate = self._services.isolate.create_from_records(
-                            otu.id, isolate_name, list(isolate_records.values())
-                        )
-                        if isolate:
-                            new_isolate_ids.append(isolate.id)
-                    except ValueError as e:
-                        log.error(
-                            "Error creating isolate",
-                            error=str(e),
-                            isolate_name=isolate_name,
-                        )
-
-                if new_isolate_ids:
-                    log.info("Added new isolates", count=len(new_isolate_ids))
+
+            if new_isolate_ids:
+                log.info("Added new isolates", count=len(new_isolate_ids))
 
         self._repo.write_otu_update_history_entry(otu.id)
 
@@ -536,6 +525,26 @@ class OTUService(Service):
         return self._repo.get_otu(otu.id)
 
 
+def _get_upgradable_accessions(
+    otu: OTU, accessions: list[Accession]
+) -> dict[Accession, Sequence]:
+    """Return server accessions that are newer versions of sequences in the OTU.
+
+    Each upgradable accession is mapped to the outdated sequence it replaces.
+
+    :param otu: the OTU
+    :param accessions: the accessions found on NCBI for the OTU
+    :return: the outdated sequences keyed by upgradable accession
+    """
+    return {
+        accession: outdated_sequence
+        for accession in accessions
+        if accession.version > 2
+        and accession not in otu.versioned_accessions
+        and (outdated_sequence := otu.get_sequence(accession.key)) is not None
+    }
+
+
 def _get_molecule_from_records(records: list[NCBIGenbank]) -> Molecule:
     """Return relevant molecule metadata from one or more records.
 
@@ -546,20 +555,13 @@ def _get_molecule_from_records(records: list[NCBIGenbank]) -> Molecule:
     if not records:
         raise ValueError("No records given")
 
-    # Assign first record as benchmark to start
-    representative_record = records[0]
+    representative_record = next(
+        (record for record in records if record.refseq), records[0]
+    )
 
-    if not representative_record.refseq:
-        for record in records:
-            if record.refseq:
-                # Replace representative record with first RefSeq record found
-                representative_record = record
-                break
-
-    return Molecule.model_validate(
-        {
-            "strandedness": representative_record.strandedness.value,
-            "type": representative_record.moltype.value,
-            "topology": representative_record.topology.value,
-        },
+    # The values come from an already validated record, so skip revalidation.
+    return Molecule.model_construct(
+        strandedness=representative_record.strandedness.value,
+        type=representative_record.moltype.value,
+        topology=representative_record.topology.value,
     )
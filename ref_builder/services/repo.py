@@ -1,15 +1,20 @@
 import datetime
-from collections.abc import Collection, Iterable, Iterator
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import batched, chain
 from uuid import UUID
 
 import arrow
 import structlog
 
+from ref_builder.index import OTUTimestamps
+from ref_builder.models.accession import Accession
 from ref_builder.models.otu import OTU
-from ref_builder.ncbi.client import NCBIClient
+from ref_builder.ncbi.client import NCBIClientProtocol, get_entrez_max_workers
 from ref_builder.ncbi.models import NCBIGenbank
 from ref_builder.ncbi.utils import group_genbank_records_by_isolate
-from ref_builder.plan import get_segments_max_length, get_segments_min_length
 from ref_builder.promote import promote_otu_from_records
 from ref_builder.services import Service
 
@@ -24,21 +29,22 @@ RECORD_FETCH_CHUNK_SIZE = 500
 UPDATE_COOLDOWN_INTERVAL_IN_DAYS = 14
 """A default chunk size for NCBI EFetch calls."""
 
+UPDATE_SEARCH_MARGIN_IN_DAYS = 2
+"""Days before an OTU's last update from which modified records are searched for.
 
-class RepoService(Service):
-    """A service for repo-level operations.
+Update timestamps are in UTC, but NCBI modification dates are in US Eastern time and
+new records can take a while to become searchable.
+"""
 
-    TODO: Avoid refetching recently updated accessions.
-    """
+
+class RepoService(Service):
+    """A service for repo-level operations."""
 
     def update(self) -> set[UUID]:
         """Update all OTUs in the repository.
 
         Fetch new accessions for all OTUs in the repo and create isolates as possible.
 
-        :param start_date: exclude records edited before this date
-        :param skip_recently_updated: skip OTUs updated within cooldown period
-        :param ignore_cache: whether to ignore the NCBI cache
         :return: set of updated OTU IDs
         """
         log = logger.bind(
@@ -49,21 +55,54 @@ class RepoService(Service):
 
         operation_run_timestamp = arrow.utcnow().naive
 
-        otu_iterator = (
-            otu
-            for otu in self._repo.iter_otus()
-            if _otu_is_cooled(
-                self._repo,
-                otu.id,
+        # Check cooldowns against the index before loading any OTUs, so OTUs that are
+        # still cooling down are never rehydrated.
+        otu_timestamps = self._repo.get_otu_timestamps()
+
+        cooled_otu_ids = [
+            otu.id
+            for otu in self._repo.iter_minimal_otus()
+            if otu.id in otu_timestamps
+            and _otu_is_cooled(
+                otu_timestamps[otu.id],
                 timestamp_current=operation_run_timestamp,
             )
+        ]
+
+        otu_iterator = (
+            otu
+            for otu_id in cooled_otu_ids
+            if (otu := self._repo.get_otu(otu_id)) is not None
         )
 
+        # Only search for records modified since each OTU was last updated. OTUs that
+        # changed after their last update, for example by allowing an accession or
+        # changing the plan, may now accept older records and are searched in full.
+        search_margin = datetime.timedelta(days=UPDATE_SEARCH_MARGIN_IN_DAYS)
+
+        modified_since_by_otu_id = {
+            otu_id: (timestamps.last_updated - search_margin).date()
+            for otu_id, timestamps in otu_timestamps.items()
+            if timestamps.last_updated is not None
+            and timestamps.last_modified <= timestamps.last_updated
+        }
+
         batch_fetch_index = _fetch_new_accessions(
+            self.ncbi,
             otu_iterator,
             repo_blocked_accessions=self._repo.accession_keys,
+            modified_since_by_otu_id=modified_since_by_otu_id,
+            unused_accessions_by_otu_id=self._repo.get_otu_unused_accessions(),
         )
 
+        # Drop taxids without an OTU before fetching, so their records are never
+        # downloaded.
+        otu_ids_by_taxid = self._repo.get_otu_ids_by_taxids(batch_fetch_index.keys())
+
+        for taxid in batch_fetch_index.keys() - otu_ids_by_taxid.keys():
+            logger.debug("No corresponding OTU found in this repo", taxid=taxid)
+            del batch_fetch_index[taxid]
+
         if not batch_fetch_index:
             logger.info("OTUs are up to date.")
             return set()
@@ -79,7 +118,7 @@ class RepoService(Service):
             for accession in otu_accessions
         }
 
-        record_index_by_accession = _fetch_new_records(fetch_set)
+        record_index_by_accession = _fetch_new_records(self.ncbi, fetch_set)
 
         if not record_index_by_accession:
             logger.info("No valid accessions found.")
@@ -88,9 +127,7 @@ class RepoService(Service):
         updated_otu_ids = set()
 
         for taxid, accessions in batch_fetch_index.items():
-            if (otu_id := self._repo.get_otu_id_by_taxid(taxid)) is None:
-                logger.debug("No corresponding OTU found in this repo", taxid=taxid)
-                continue
+            otu_id = otu_ids_by_taxid[taxid]
 
             otu_records = [
                 record
@@ -107,16 +144,8 @@ class RepoService(Service):
 
                 # Promote RefSeq accessions first
                 refseq_records = [r for r in otu_records if r.refseq]
-                if refseq_records and promote_otu_from_records(
-                    self._repo, otu, refseq_records
-                ):
-                    otu = self._repo.get_otu(otu_id)
-
-                    if otu is None:
-                        logger.debug(
-                            "No corresponding OTU found in this repo", taxid=taxid
-                        )
-                        continue
+                if refseq_records:
+                    _, otu = promote_otu_from_records(self._repo, otu, refseq_records)
 
                 # Create isolates from records
                 for isolate_name, isolate_records in group_genbank_records_by_isolate(
@@ -135,16 +164,76 @@ class RepoService(Service):
                             isolate_name=isolate_name,
                         )
 
-            self._repo.write_otu_update_history_entry(otu_id)
+            # Record accessions that could not be added to the OTU, such as the
+            # segments of an incomplete isolate. The next update only searches for
+            # recently modified records, so these are fetched again alongside them.
+            if (otu := self._repo.get_otu(otu_id)) is None:
+                continue
+
+            unused_accessions = sorted(accessions - otu.blocked_accessions)
+
+            if unused_accessions:
+                logger.info(
+                    "Accessions could not be added to OTU.",
+                    taxid=taxid,
+                    accessions=unused_accessions,
+                )
+
+            self._repo.write_otu_update_history_entry(
+                otu_id, unused_accessions=unused_accessions
+            )
 
         log.info("Batch update complete.", new_isolate_count=len(updated_otu_ids))
 
         return updated_otu_ids
 
 
+@dataclass(frozen=True)
+class _AccessionSearch:
+    """The OTU fields needed to search NCBI Nucleotide for new accessions."""
+
+    taxid: int
+    """The NCBI Taxonomy ID of the OTU."""
+
+    name: str
+    """The name of the OTU."""
+
+    min_length: int
+    """The shortest sequence length accepted by the OTU plan."""
+
+    max_length: int
+    """The longest sequence length accepted by the OTU plan."""
+
+    blocked_accessions: frozenset[str]
+    """Accession keys that should not be added to the OTU."""
+
+    modified_since: datetime.date | None = None
+    """Only records modified on or after this date are searched for, if set."""
+
+    unused_accessions: frozenset[str] = frozenset()
+    """Accession keys left unused by the last update, which are fetched again."""
+
+    @classmethod
+    def from_otu(
+        cls,
+        otu: OTU,
+        modified_since: datetime.date | None = None,
+        unused_accessions: Collection[str] = (),
+    ) -> "_AccessionSearch":
+        """Return the search parameters for an OTU."""
+        return cls(
+            taxid=otu.taxid,
+            name=otu.name,
+            min_length=otu.plan.min_segment_length,
+            max_length=otu.plan.max_segment_length,
+            blocked_accessions=otu.blocked_accessions,
+            modified_since=modified_since,
+            unused_accessions=frozenset(unused_accessions),
+        )
+
+
 def _otu_is_cooled(
-    repo,
-    otu_id: UUID,
+    timestamps: OTUTimestamps,
     timestamp_current: datetime.datetime | None,
     cooldown: int = UPDATE_COOLDOWN_INTERVAL_IN_DAYS,
 ) -> bool:
@@ -160,15 +249,15 @@ def _otu_is_cooled(
     if timestamp_current is None:
         timestamp_current = arrow.utcnow().naive
 
-    if (timestamp_last_updated := repo.get_otu_last_updated(otu_id)) is not None:
+    if (timestamp_last_updated := timestamps.last_updated) is not None:
         return timestamp_current - timestamp_last_updated > cooldown_delta
 
-    timestamp_created = repo.get_otu_first_created(otu_id)
+    timestamp_created = timestamps.first_created
 
     if (timestamp_current - timestamp_created) <= cooldown_delta:
         return True
 
-    timestamp_latest = repo.get_otu_last_modified(otu_id)
+    timestamp_latest = timestamps.last_modified
 
     if (timestamp_current - timestamp_latest) > cooldown_delta:
         return True
@@ -185,9 +274,11 @@ def _otu_is_cooled(
 
 
 def _fetch_new_accessions(
+    ncbi: NCBIClientProtocol,
     otus: Iterable[OTU],
-    ignore_cache: bool = False,
     repo_blocked_accessions: set[str] | None = None,
+    modified_since_by_otu_id: Mapping[UUID, datetime.date] | None = None,
+    unused_accessions_by_otu_id: Mapping[UUID, Collection[str]] | None = None,
 ) -> dict[int, set[str]]:
     """Check OTU iterator for new accessions and return results indexed by taxid.
 
@@ -195,92 +286,139 @@ def _fetch_new_accessions(
     stored in the repo. Subtracting it here prevents re-fetching accessions that
     already live in a different OTU (e.g. after a taxonomic reclassification at
     NCBI). The write-time guard in ``Repo`` catches anything missed by this filter.
-    """
-    ncbi = NCBIClient(ignore_cache)
 
+    ``ncbi`` is the service's shared client, so its cache and ``ignore_cache`` setting
+    are honoured rather than a new client being created per batch.
+
+    ``modified_since_by_otu_id`` limits the search for an OTU to records modified on or
+    after the given date, usually the date of its last update. Older records were
+    already considered in that update.
+
+    ``unused_accessions_by_otu_id`` holds accession keys that an OTU's last update
+    fetched but could not use, such as the segments of an incomplete isolate. They are
+    fetched again with the search results, since they may be usable together with
+    newly modified records.
+
+    Searches for different OTUs run concurrently, up to the NCBI request rate limit.
+    Only the fields needed for the search are kept for OTUs that are waiting.
+    """
     if repo_blocked_accessions is None:
         repo_blocked_accessions = set()
 
-    otu_counter = 0
-
-    taxid_accession_index = {}
+    if modified_since_by_otu_id is None:
+        modified_since_by_otu_id = {}
 
-    for otu in otus:
-        log = logger.bind(taxid=otu.taxid, name=otu.name)
+    if unused_accessions_by_otu_id is None:
+        unused_accessions_by_otu_id = {}
 
-        otu_counter += 1
+    otu_counter = 0
 
-        if otu_counter % OTU_FEEDBACK_INTERVAL == 0:
-            log.info(
-                "Fetching accession updates...",
-                otu_counter=otu_counter,
-            )
+    taxid_accession_index = {}
 
-        accessions = ncbi.fetch_accessions_by_taxid(
-            otu.taxid,
-            sequence_min_length=get_segments_min_length(otu.plan.segments),
-            sequence_max_length=get_segments_max_length(otu.plan.segments),
+    searches = (
+        _AccessionSearch.from_otu(
+            otu,
+            modified_since_by_otu_id.get(otu.id),
+            unused_accessions_by_otu_id.get(otu.id, ()),
         )
+        for otu in otus
+    )
 
-        accessions_to_fetch = (
-            {accession.key for accession in accessions}
-            - otu.blocked_accessions
-            - repo_blocked_accessions
-        )
+    with ThreadPoolExecutor(max_workers=get_entrez_max_workers()) as executor:
+        results = executor.map(partial(_search_accessions, ncbi), searches)
+
+        for search, accessions in results:
+            log = logger.bind(taxid=search.taxid, name=search.name)
+
+            otu_counter += 1
+
+            if otu_counter % OTU_FEEDBACK_INTERVAL == 0:
+                log.info(
+                    "Fetching accession updates...",
+                    otu_counter=otu_counter,
+                )
+
+            # Check both sets rather than building their union, which would copy every
+            # accession key in the repo once per OTU.
+            accessions_to_fetch = {
+                key
+                for key in chain(
+                    (accession.key for accession in accessions),
+                    search.unused_accessions,
+                )
+                if key not in search.blocked_accessions
+                and key not in repo_blocked_accessions
+            }
+
+            if accessions_to_fetch:
+                log.debug(
+                    "Potential accessions found.",
+                    accession_count=len(accessions_to_fetch),
+                    otu_counter=otu_counter,
+                )
+
+                taxid_accession_index[search.taxid] = accessions_to_fetch
 
-        if accessions_to_fetch:
-            log.debug(
-                "Potential accessions found.",
-                accession_count=len(accessions_to_fetch),
-                otu_counter=otu_counter,
-            )
+    return taxid_accession_index
 
-            taxid_accession_index[otu.taxid] = accessions_to_fetch
 
-    return taxid_accession_index
+def _search_accessions(
+    ncbi: NCBIClientProtocol, search: _AccessionSearch
+) -> tuple[_AccessionSearch, list[Accession]]:
+    """Search NCBI Nucleotide for accessions matching an OTU's taxid and plan.
+
+    :param ncbi: the NCBI client
+    :param search: the search parameters
+    :return: the search parameters and the accessions found
+    """
+    return search, ncbi.fetch_accessions_by_taxid(
+        search.taxid,
+        sequence_min_length=search.min_length,
+        sequence_max_length=search.max_length,
+        modification_date_start=search.modified_since,
+    )
 
 
 def _iter_fetch_list(
-    fetch_list: list[str], page_size: int = RECORD_FETCH_CHUNK_SIZE
+    fetch_list: Iterable[str], page_size: int = RECORD_FETCH_CHUNK_SIZE
 ) -> Iterator[list[str]]:
-    """Divide a list of accessions and yield in pages."""
-    page_size = max(1, page_size)
-    page_count = len(fetch_list) // page_size + int(len(fetch_list) % page_size != 0)
-
-    for iterator in range(page_count):
-        yield fetch_list[iterator * page_size : (iterator + 1) * page_size]
+    """Divide a collection of accessions and yield in pages."""
+    for page in batched(fetch_list, max(1, page_size), strict=False):
+        yield list(page)
 
 
 def _fetch_new_records(
+    ncbi: NCBIClientProtocol,
     accessions: Collection[str],
     chunk_size: int = RECORD_FETCH_CHUNK_SIZE,
-    ignore_cache: bool = False,
 ) -> dict[str, NCBIGenbank]:
-    """Download a batch of records and return in a dictionary indexed by accession."""
+    """Download a batch of records and return in a dictionary indexed by accession.
+
+    Pages are fetched concurrently, up to the NCBI request rate limit, so requests
+    overlap with the parsing and validation of earlier pages.
+    """
     log = logger.bind(
         accession_count=len(accessions),
         chunk_size=chunk_size,
-        ignore_cache=ignore_cache,
+        ignore_cache=ncbi.ignore_cache,
     )
 
     if not accessions:
         return {}
 
-    ncbi = NCBIClient(ignore_cache)
-
-    fetch_list = list(accessions)
-
-    page_counter = 0
-
     indexed_records = {}
-    for fetch_list_chunk in _iter_fetch_list(fetch_list, chunk_size):
-        log.info("Fetching records...", page_counter=page_counter)
 
-        chunked_records = ncbi.fetch_genbank_records(fetch_list_chunk)
+    with ThreadPoolExecutor(max_workers=get_entrez_max_workers()) as executor:
+        pages = executor.map(
+            ncbi.fetch_genbank_records, _iter_fetch_list(accessions, chunk_size)
+        )
 
-        indexed_records.update({record.accession: record for record in chunked_records})
+        for page_counter, chunked_records in enumerate(pages):
+            log.info("Fetched records.", page_counter=page_counter)
 
-        page_counter += 1
+            indexed_records.update(
+                {record.accession: record for record in chunked_records}
+            )
 
     if indexed_records:
         return indexed_records
@@ -1,21 +1,33 @@
 import re
+from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
 from enum import StrEnum
+from pathlib import Path
+from uuid import uuid4
 
-from ref_builder.models.accession import Accession
+from ref_builder.models.accession import REFSEQ_ACCESSION_PATTERN, Accession
 
 ZERO_PADDING_MAX = 99999999
 """The maximum number that can be padded with zeroes in event IDs and filenames."""
 
-GENBANK_ACCESSION_PATTERN = re.compile(pattern=r"^[A-Z]{1,2}[0-9]{5,6}$")
+GENBANK_ACCESSION_PATTERN = re.compile(pattern=r"[A-Z]{1,2}[0-9]{5,6}")
+"""Genbank accession key pattern.
 
-REFSEQ_ACCESSION_PATTERN = re.compile(pattern=r"^NC_[0-9A-Z]+$")
-"""RefSeq accession pattern for viral complete genomic molecules (NC_ prefix).
+The pattern is unanchored so it can be combined with others. Use it with
+``fullmatch``.
+"""
 
-The identifier following the underscore can be alphanumeric and of variable length.
+ACCESSION_KEY_PATTERN = re.compile(
+    pattern=f"{GENBANK_ACCESSION_PATTERN.pattern}|{REFSEQ_ACCESSION_PATTERN.pattern}"
+)
+"""A Genbank or RefSeq accession key pattern.
 
-Examples: NC_003619, NC_010314, NC_ABC123
+Use with ``fullmatch`` to check both kinds of key with a single regex.
 """
 
+NATURAL_SORT_SPLIT_PATTERN = re.compile(pattern=r"([0-9]+)")
+"""A pattern for splitting a string into alternating text and digit parts."""
+
 
 class ExcludedAccessionAction(StrEnum):
     """Possible actions that can be taken on the excluded/allowed status of an accession."""
@@ -26,10 +38,7 @@ class ExcludedAccessionAction(StrEnum):
 
 def is_accession_key_valid(accession_key: str) -> bool:
     """Return True if the given accession is a valid Genbank or RefSeq accession."""
-    return (
-        GENBANK_ACCESSION_PATTERN.match(accession_key) is not None
-        or REFSEQ_ACCESSION_PATTERN.match(accession_key) is not None
-    )
+    return ACCESSION_KEY_PATTERN.fullmatch(accession_key) is not None
 
 
 def get_accession_key(raw: str) -> str:
@@ -44,15 +53,13 @@ def get_accession_key(raw: str) -> str:
     except ValueError:
         raise ValueError("Invalid accession key")
 
-    if GENBANK_ACCESSION_PATTERN.match(
-        versioned_accession.key
-    ) or REFSEQ_ACCESSION_PATTERN.match(versioned_accession.key):
+    if is_accession_key_valid(versioned_accession.key):
         return versioned_accession.key
 
     raise ValueError("Invalid accession key")
 
 
-def generate_natural_sort_key(string: str) -> list[int | str]:
+def generate_natural_sort_key(string: str) -> tuple[int | str, ...]:
     """Generate a natural order sorting key for a string.
 
     This list: ["1", "10", "2"] will be sorted as ["1", "2", "10"], as opposed to
@@ -61,24 +68,30 @@ def generate_natural_sort_key(string: str) -> list[int | str]:
     :param string: the string to convert to a sorting key
     :return: the sorting key
     """
-
-    def _convert(string_: str) -> int | str:
-        return int(string_) if string_.isdigit() else string_.lower()
-
-    return [_convert(c) for c in re.split("([0-9]+)", string)]
+    return tuple(
+        int(part) if part.isdecimal() else part.lower()
+        for part in NATURAL_SORT_SPLIT_PATTERN.split(string)
+    )
 
 
 def filter_accessions(
-    accessions: list[str],
-    blocked: set[str],
+    accessions: Iterable[str],
+    *blocked: AbstractSet[str],
 ) -> list[str]:
     """Filter a list of accessions by removing blocked accessions.
 
-    :param accessions: list of accession strings to filter
-    :param blocked: set of blocked accession strings
+    Each set of blocked accessions is checked in turn, so they never have to be
+    combined into one.
+
+    :param accessions: accession strings to filter
+    :param blocked: sets of blocked accession strings
     :return: filtered list of accessions
     """
-    return [acc for acc in accessions if acc not in blocked]
+    return [
+        accession
+        for accession in accessions
+        if not any(accession in blocked_set for blocked_set in blocked)
+    ]
 
 
 def pad_zeroes(number: int) -> str:
@@ -91,3 +104,23 @@ def pad_zeroes(number: int) -> str:
         raise ValueError("Number is too large to pad")
 
     return str(number).zfill(8)
+
+
+def write_file_atomically(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` without ever exposing a partially written file.
+
+    The data is written to a temporary file next to ``path``, which then replaces
+    ``path`` in a single step.
+
+    :param path: the path to write to
+    :param data: the data to write
+    """
+    temporary_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+
+    try:
+        with open(temporary_path, "wb") as f:
+            f.write(data)
+
+        temporary_path.replace(path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
@@ -0,0 +1,15 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from tests.fixtures.mock_ncbi_client import MockNCBIClient
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _mock_cli_ncbi_client(module_mocker: MockerFixture) -> None:
+    """Make CLI commands use the mock NCBI client instead of querying NCBI.
+
+    Module-scoped so that module-scoped repository templates built through the CLI
+    use it too.
+    """
+    for module in ("event", "isolate", "main", "otu"):
+        module_mocker.patch(f"ref_builder.cli.{module}.NCBIClient", MockNCBIClient)
@@ -51,13 +51,13 @@ class TestIsolateCreateCommand:
         assert result.exit_code == 0
         assert "Isolate created" in result.output
 
-    def test_duplicate_accessions(self, scratch_repo: Repo):
+    def test_duplicate_accessions(self, empty_repo: Repo):
         """Test that an error is raised when duplicate accessions are provided."""
         result = runner.invoke(
             isolate_command_group,
             [
                 "--path",
-                str(scratch_repo.path),
+                str(empty_repo.path),
                 "create",
                 "DQ178610",
                 "DQ178610",
@@ -97,13 +97,13 @@ class TestIsolateGetCommand:
 
             assert result.exit_code == 0
 
-    def test_missing_id(self, scratch_repo: Repo):
+    def test_missing_id(self, empty_repo: Repo):
         """Test that an empty isolate identifier string exits with an error."""
         result = runner.invoke(
             isolate_command_group,
             [
                 "--path",
-                str(scratch_repo.path),
+                str(empty_repo.path),
                 "get",
                 "",
             ],
@@ -145,18 +145,16 @@ class TestIsolateDeleteCommand:
         assert result.exit_code == 0
         assert "Isolate deleted" in result.output
 
-        otu = scratch_repo.get_otu_by_taxid(
-            mock_ncbi_client.otus.wasabi_mottle_virus.taxid
-        )
+        otu = scratch_repo.get_otu(otu.id)
 
         assert otu
         assert isolate_id not in otu.isolate_ids
 
-    def test_missing_id(self, scratch_repo: Repo):
+    def test_missing_id(self, empty_repo: Repo):
         """Test that an empty isolate identifier string exits with an error."""
         result = runner.invoke(
             isolate_command_group,
-            ["--path", str(scratch_repo.path), "delete", ""],
+            ["--path", str(empty_repo.path), "delete", ""],
         )
 
         assert result.exit_code == 2
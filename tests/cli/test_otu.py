@@ -1,3 +1,6 @@
+import shutil
+from pathlib import Path
+
 import pytest
 from click.testing import CliRunner
 from pytest_mock import MockerFixture
@@ -29,74 +32,83 @@ class TestCreateOTU:
 
         assert result.exit_code == 0
 
-        otus = list(Repo(empty_repo.path).iter_otus())
+        otus = list(empty_repo.iter_otus())
 
         assert len(otus) == 1
         assert otus[0].taxid == taxid
 
 
+@pytest.fixture(scope="module")
+def duplicate_taxonomy_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a repository with an OTU created from NC_001367 and return its path.
+
+    The repository is built once per module and copied for each test.
+    """
+    path = tmp_path_factory.mktemp("duplicate_taxonomy") / "test_repo"
+
+    Repo.new("Generic Viruses", path, "virus")
+
+    result = runner.invoke(
+        otu_command_group,
+        ["--path", str(path), "create", "NC_001367"],
+    )
+
+    assert result.exit_code == 0
+
+    return path
+
+
+@pytest.fixture
+def duplicate_taxonomy_repo(
+    duplicate_taxonomy_repo_template: Path, tmp_path: Path
+) -> Repo:
+    """Return a fresh copy of the NC_001367 template repository."""
+    path = tmp_path / "test_repo"
+
+    shutil.copytree(duplicate_taxonomy_repo_template, path)
+
+    return Repo(path)
+
+
 class TestCreateOTUWithDuplicateTaxonomy:
     """Test the behaviour of ``ref-builder otu create`` with duplicate taxonomy IDs."""
 
-    def test_without_flag_shows_error(self, empty_repo: Repo):
+    def test_without_flag_shows_error(self, duplicate_taxonomy_repo: Repo):
         """Test that creating OTU with duplicate taxid without flag shows error."""
-        # Create first OTU
-        result = runner.invoke(
-            otu_command_group,
-            ["--path", str(empty_repo.path), "create", "NC_001367"],
-        )
-        assert result.exit_code == 0
-
         # Try to create another OTU with same taxonomy ID without flag
         result = runner.invoke(
             otu_command_group,
-            ["--path", str(empty_repo.path), "create", "V01408"],
+            ["--path", str(duplicate_taxonomy_repo.path), "create", "V01408"],
         )
 
         assert result.exit_code == 1
         assert "OTU already exists for taxonomy ID 3432891" in result.output
         assert "Use -i/--create-isolate to create an isolate instead" in result.output
 
-    def test_with_flag_creates_isolate(self, empty_repo: Repo):
+    def test_with_flag_creates_isolate(self, duplicate_taxonomy_repo: Repo):
         """Test that creating OTU with duplicate taxid and flag creates isolate."""
-        # Create first OTU
-        result = runner.invoke(
-            otu_command_group,
-            ["--path", str(empty_repo.path), "create", "NC_001367"],
-        )
-        assert result.exit_code == 0
-
-        repo = Repo(empty_repo.path)
-        otus = list(repo.iter_otus())
+        otus = list(duplicate_taxonomy_repo.iter_otus())
         assert len(otus) == 1
         initial_isolate_count = len(otus[0].isolate_ids)
 
         # Try to create another OTU with same taxonomy ID using -i flag
         result = runner.invoke(
             otu_command_group,
-            ["--path", str(empty_repo.path), "create", "-i", "OQ953825"],
+            ["--path", str(duplicate_taxonomy_repo.path), "create", "-i", "OQ953825"],
         )
 
         assert result.exit_code == 0
         assert "Created isolate in existing OTU (taxid: 3432891)" in result.output
 
         # Verify isolate was added to existing OTU
-        repo = Repo(empty_repo.path)
-        otus = list(repo.iter_otus())
+        otus = list(duplicate_taxonomy_repo.iter_otus())
         assert len(otus) == 1  # Still only one OTU
         assert len(otus[0].isolate_ids) == initial_isolate_count + 1  # One more isolate
 
     def test_with_flag_but_isolate_creation_fails(
-        self, empty_repo: Repo, mocker: MockerFixture
+        self, duplicate_taxonomy_repo: Repo, mocker: MockerFixture
     ):
         """Test proper error handling when isolate creation fails even with flag."""
-        # Create first OTU
-        result = runner.invoke(
-            otu_command_group,
-            ["--path", str(empty_repo.path), "create", "NC_001367"],
-        )
-        assert result.exit_code == 0
-
         # Mock isolate.create to return None (failure)
         mocker.patch(
             "ref_builder.services.isolate.IsolateService.create",
@@ -106,7 +118,7 @@ class TestCreateOTUWithDuplicateTaxonomy:
         # Try to create with -i flag but isolate creation fails
         result = runner.invoke(
             otu_command_group,
-            ["--path", str(empty_repo.path), "create", "-i", "V01408"],
+            ["--path", str(duplicate_taxonomy_repo.path), "create", "-i", "V01408"],
         )
 
         assert result.exit_code == 1
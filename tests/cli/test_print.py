@@ -19,7 +19,7 @@ class TestOTUGet:
     """Test otu console printing commands."""
 
     def test_plain(self, scratch_repo: Repo):
-        for otu_ in scratch_repo.iter_otus():
+        for otu_ in scratch_repo.iter_minimal_otus():
             result = runner.invoke(
                 otu_command_group,
                 ["--path", str(scratch_repo.path), "get", str(otu_.id)],
@@ -32,7 +32,7 @@ class TestOTUGet:
 
     def test_json(self, scratch_repo: Repo):
         """Test otu console printing commands with JSON output."""
-        for otu_ in scratch_repo.iter_otus():
+        for otu_ in scratch_repo.iter_minimal_otus():
             result = runner.invoke(
                 otu_command_group,
                 ["--path", str(scratch_repo.path), "get", str(otu_.id), "--json"],
@@ -43,10 +43,10 @@ class TestOTUGet:
 
             assert result.exit_code == 0
 
-    def test_empty(self, scratch_repo):
+    def test_empty(self, empty_repo: Repo):
         """Test that an empty ID string raises an error."""
         result = runner.invoke(
-            otu_command_group, ["--path", str(scratch_repo.path), "get", ""]
+            otu_command_group, ["--path", str(empty_repo.path), "get", ""]
         )
 
         if result.exit_code != 1:
@@ -8,7 +8,11 @@ from polyfactory.decorators import post_generated
 from polyfactory.factories.pydantic_factory import ModelFactory
 
 from ref_builder.models.molecule import Molecule, MoleculeType
-from ref_builder.models.plan import Plan
+from ref_builder.models.plan import (
+    Plan,
+    get_segments_max_length,
+    get_segments_min_length,
+)
 from ref_builder.ncbi.models import (
     NCBIGenbank,
     NCBILineage,
@@ -18,7 +22,6 @@ from ref_builder.ncbi.models import (
     NCBITaxonomy,
     NCBITaxonomyOtherNames,
 )
-from ref_builder.plan import get_segments_max_length, get_segments_min_length
 from tests.fixtures.providers import (
     AccessionProvider,
     OrganismProvider,
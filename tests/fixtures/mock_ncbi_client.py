@@ -1,6 +1,6 @@
 """Mock NCBI client for testing without real API calls or file cache."""
 
-import json
+import datetime as dt
 from collections.abc import Collection
 from contextlib import contextmanager
 from pathlib import Path
@@ -15,7 +15,7 @@ from ref_builder.ncbi.models import (
     NCBITaxonomy,
 )
 from tests.fixtures.ncbi.manifest import OTUManifest
-from tests.fixtures.ncbi.models import OTURegistry
+from tests.fixtures.ncbi.models import OTURegistry, load_otu_data
 
 logger = get_logger("tests.mock_ncbi_client")
 
@@ -55,7 +55,7 @@ class MockNCBIClient:
         data_dir = Path(__file__).parent / "ncbi" / "otus"
 
         for json_file in data_dir.glob("*.json"):
-            data = json.loads(json_file.read_text())
+            data = load_otu_data(json_file)
 
             taxonomy = NCBITaxonomy.model_validate(data["taxonomy"])
             self._taxonomy_records[taxonomy.id] = taxonomy
@@ -378,6 +378,7 @@ class MockNCBIClient:
         sequence_min_length: int | None = None,
         sequence_max_length: int | None = None,
         refseq_only: bool = False,
+        modification_date_start: dt.date | None = None,  # noqa: ARG002
     ) -> list[Accession]:
         """Fetch mock accessions for a given taxid from loaded OTU data.
 
@@ -386,6 +387,7 @@ class MockNCBIClient:
             sequence_min_length: Minimum sequence length filter (ignored in mock)
             sequence_max_length: Maximum sequence length filter (ignored in mock)
             refseq_only: If True, only return RefSeq accessions
+            modification_date_start: Modification date filter (ignored in mock)
 
         Returns:
             List of Accession objects from the OTU structure
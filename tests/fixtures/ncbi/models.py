@@ -2,9 +2,20 @@
 
 import json
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
 
+@cache
+def load_otu_data(json_path: Path) -> dict:
+    """Load the mock NCBI data for an OTU from ``json_path``.
+
+    Each file is only read once per test session. The returned data is shared, so it
+    must not be modified.
+    """
+    return json.loads(json_path.read_text())
+
+
 class OTUSpec:
     """Declares the GenBank accessions needed for a mock OTU."""
 
@@ -64,7 +75,7 @@ class OTURegistry:
         if not json_path.exists():
             return None
 
-        data = json.loads(json_path.read_text())
+        data = load_otu_data(json_path)
 
         # Mirror OTUService.create() behavior: return species-level taxid
         # If taxonomy rank is not 'species', find species-level ancestor in lineage
@@ -91,7 +102,7 @@ class OTURegistry:
                 )
 
             json_path = self._data_dir / f"{attr_name}.json"
-            data = json.loads(json_path.read_text())
+            data = load_otu_data(json_path)
             genbank_accessions = list(data["genbank"].keys())
 
             # Match manifest entries (versioned or unversioned) to data
@@ -118,6 +118,20 @@ class TestOTU:
             "Tobamovirus tabaci",
         }
 
+    def test_accessions(self):
+        """Test that the accession sets reflect the OTU sequences after a rebuild."""
+        assert self.otu.accessions == {"NC_001367", "AF395128"}
+        assert self.otu.versioned_accessions == {
+            Accession("NC_001367", 1),
+            Accession("AF395128", 1),
+        }
+
+        self.otu.isolates.pop()
+        self.otu.rebuild_lookups()
+
+        assert self.otu.accessions == {"NC_001367"}
+        assert self.otu.versioned_accessions == {Accession("NC_001367", 1)}
+
     def test_no_required_segments(self):
         """Test that OTU raises a warning if initialized without required segments."""
         segment_id = uuid4()
@@ -11,6 +11,8 @@ from ref_builder.models.plan import (
     SegmentName,
     SegmentRule,
     extract_segment_name_from_record,
+    get_segments_max_length,
+    get_segments_min_length,
 )
 from ref_builder.ncbi.models import NCBISourceMolType
 from ref_builder.plan import extract_segment_name_from_record_with_plan
@@ -192,6 +194,42 @@ class TestPlan:
         assert plan.not_required_segments == [plan.segments[1], plan.segments[3]]
         assert plan.required_segments == [plan.segments[0], plan.segments[2]]
 
+    def test_segment_length_bounds(self):
+        """Test that the segment length bounds match the segment length helpers."""
+        self.example["segments"] = [
+            {
+                **self.example["segments"][0],
+                "length": length,
+                "length_tolerance": 0.1,
+                "name": {"prefix": "DNA", "key": key},
+            }
+            for key, length in zip("AB", [1000, 2000], strict=True)
+        ]
+
+        plan = Plan.model_validate(self.example)
+
+        assert plan.min_segment_length == get_segments_min_length(plan.segments) == 900
+        assert plan.max_segment_length == get_segments_max_length(plan.segments) == 2200
+
+    def test_segment_name_lookups(self):
+        """Test that segments can be looked up by name and prefixes by name key."""
+        self.example["segments"] = [
+            {
+                **self.example["segments"][0],
+                "id": uuid4(),
+                "name": {"prefix": prefix, "key": key},
+            }
+            for prefix, key in [("DNA", "A"), ("RNA", "B")]
+        ]
+
+        plan = Plan.model_validate(self.example)
+
+        assert plan.segments_by_name == {
+            SegmentName("DNA", "A"): plan.segments[0],
+            SegmentName("RNA", "B"): plan.segments[1],
+        }
+        assert plan.segment_prefixes_by_key == {"A": "DNA", "B": "RNA"}
+
 
 class TestSegmentName:
     """Test segment name normalization."""
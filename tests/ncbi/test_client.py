@@ -1,8 +1,20 @@
+import socket
+from email.message import Message
+from io import BytesIO
+from urllib.error import HTTPError, URLError
+
 import pytest
+from pytest_mock import MockerFixture
 from syrupy.assertion import SnapshotAssertion
 
 from ref_builder.models.accession import Accession
-from ref_builder.ncbi.client import NCBIClient, TaxonLevelError
+from ref_builder.ncbi.client import (
+    ENTREZ_REQUEST_INTERVAL,
+    NCBIClient,
+    TaxonLevelError,
+    _EntrezRequestThrottle,
+)
+from ref_builder.ncbi.models import NCBIRank
 
 
 class TestFetchGenbank:
@@ -89,6 +101,132 @@ class TestFetchGenbank:
             == snapshot
         )
 
+    def test_fetch_batches(
+        self, mocker: MockerFixture, uncached_ncbi_client: NCBIClient
+    ):
+        """Test that accessions are split into batches and every batch is fetched."""
+        mocker.patch("ref_builder.ncbi.client.EFETCH_BATCH_SIZE", 2)
+
+        fetch = mocker.patch.object(
+            NCBIClient, "fetch_unvalidated_genbank_records", return_value=[]
+        )
+
+        accessions = ["MN000001", "MN000002", "MN000003", "MN000004", "MN000005"]
+
+        assert uncached_ncbi_client.fetch_genbank_records(accessions) == []
+
+        assert sorted(call.args[0] for call in fetch.call_args_list) == [
+            ("MN000001", "MN000002"),
+            ("MN000003", "MN000004"),
+            ("MN000005",),
+        ]
+
+    def test_fetch_batches_space_requests(
+        self, mocker: MockerFixture, uncached_ncbi_client: NCBIClient
+    ):
+        """Test that concurrent batch requests start at least one request interval
+        apart and that no lock is held while waiting or during a request.
+        """
+        mocker.patch("ref_builder.ncbi.client.EFETCH_BATCH_SIZE", 1)
+        mocker.patch("ref_builder.ncbi.client.Entrez.api_key", None)
+        mocker.patch("ref_builder.ncbi.client.time.monotonic", return_value=100.0)
+
+        throttle = _EntrezRequestThrottle()
+        mocker.patch("ref_builder.ncbi.client._entrez_request_throttle", throttle)
+
+        lock_held = []
+
+        def sleep(_: float) -> None:
+            lock_held.append(throttle.lock.locked())
+
+        def efetch(**_: object) -> None:
+            lock_held.append(throttle.lock.locked())
+
+        sleep_mock = mocker.patch(
+            "ref_builder.ncbi.client.time.sleep", side_effect=sleep
+        )
+        mocker.patch("ref_builder.ncbi.client.Entrez.efetch", side_effect=efetch)
+        mocker.patch("ref_builder.ncbi.client.Entrez.read", return_value=[])
+
+        uncached_ncbi_client.fetch_genbank_records(["MN000001", "MN000002", "MN000003"])
+
+        assert sorted(call.args[0] for call in sleep_mock.mock_calls) == pytest.approx(
+            [ENTREZ_REQUEST_INTERVAL, 2 * ENTREZ_REQUEST_INTERVAL]
+        )
+        assert not any(lock_held)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            HTTPError("https://eutils.ncbi.nlm.nih.gov", 429, "", Message(), None),
+            HTTPError("https://eutils.ncbi.nlm.nih.gov", 503, "", Message(), None),
+            URLError(ConnectionResetError("Connection reset by peer")),
+            URLError(TimeoutError("The read operation timed out")),
+        ],
+        ids=["rate_limited", "server_error", "connection_reset", "timeout"],
+    )
+    def test_fetch_retries_with_backoff(
+        self, error: Exception, mocker: MockerFixture, uncached_ncbi_client: NCBIClient
+    ):
+        """Test that rate limited, failed and dropped requests are retried after
+        exponentially increasing delays.
+        """
+        mocker.patch("ref_builder.ncbi.client._EntrezRequestThrottle.wait")
+
+        efetch = mocker.patch(
+            "ref_builder.ncbi.client.Entrez.efetch",
+            side_effect=[error, error, mocker.Mock()],
+        )
+        mocker.patch("ref_builder.ncbi.client.Entrez.read", return_value=[])
+        sleep = mocker.patch("ref_builder.ncbi.client.time.sleep")
+
+        assert uncached_ncbi_client.fetch_genbank_records(["MN000001"]) == []
+        assert efetch.call_count == 3
+        assert [call.args[0] for call in sleep.mock_calls] == [1.0, 2.0]
+
+    def test_fetch_no_retry_on_client_error(
+        self, mocker: MockerFixture, uncached_ncbi_client: NCBIClient
+    ):
+        """Test that a request is not retried when NCBI rejects it."""
+        mocker.patch("ref_builder.ncbi.client._EntrezRequestThrottle.wait")
+
+        efetch = mocker.patch(
+            "ref_builder.ncbi.client.Entrez.efetch",
+            side_effect=HTTPError(
+                "https://eutils.ncbi.nlm.nih.gov", 400, "", Message(), BytesIO()
+            ),
+        )
+        sleep = mocker.patch("ref_builder.ncbi.client.time.sleep")
+
+        assert uncached_ncbi_client.fetch_genbank_records(["MN000001"]) == []
+        assert efetch.call_count == 1
+        sleep.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            URLError(socket.gaierror(-2, "Name or service not known")),
+            URLError(ConnectionRefusedError("Connection refused")),
+        ],
+        ids=["dns_failure", "connection_refused"],
+    )
+    def test_fetch_no_retry_on_connection_failure(
+        self, error: Exception, mocker: MockerFixture, uncached_ncbi_client: NCBIClient
+    ):
+        """Test that a request that cannot reach NCBI fails without being retried."""
+        mocker.patch("ref_builder.ncbi.client._EntrezRequestThrottle.wait")
+
+        efetch = mocker.patch(
+            "ref_builder.ncbi.client.Entrez.efetch", side_effect=error
+        )
+        sleep = mocker.patch("ref_builder.ncbi.client.time.sleep")
+
+        with pytest.raises(URLError):
+            uncached_ncbi_client.fetch_genbank_records(["MN000001"])
+
+        assert efetch.call_count == 1
+        sleep.assert_not_called()
+
     def test_fetch_non_existent_accession(self, scratch_ncbi_client: NCBIClient):
         """Test that the client returns an empty list when the fetched accession does
         not exist.
@@ -219,6 +357,16 @@ class TestFetchTaxonomy:
         assert record.model_dump() == snapshot
         assert uncached_ncbi_client.cache.load_taxonomy(1198450)
 
+    def test_memoized(self, mocker: MockerFixture, scratch_ncbi_client: NCBIClient):
+        """Test that a taxonomy record is only loaded once per client."""
+        spy = mocker.spy(scratch_ncbi_client.cache, "load_taxonomy")
+
+        record = scratch_ncbi_client.fetch_taxonomy_record(1169032)
+
+        assert record is not None
+        assert scratch_ncbi_client.fetch_taxonomy_record(1169032) is record
+        assert spy.call_count == 1
+
     def test_not_found(self, uncached_ncbi_client: NCBIClient):
         """Test that the client returns None when the taxid does not exist."""
         assert uncached_ncbi_client.fetch_taxonomy_record(99999999) is None
@@ -233,6 +381,40 @@ class TestFetchTaxonomy:
         with pytest.raises(TaxonLevelError):
             uncached_ncbi_client.fetch_taxonomy_record(190729)
 
+    def test_fetch_descendant_taxids(
+        self, mocker: MockerFixture, uncached_ncbi_client: NCBIClient
+    ):
+        """Test that descendant taxonomy records are all fetched and only subspecific
+        taxids are returned, in search order.
+        """
+        ranks = {
+            101: NCBIRank.NO_RANK,
+            102: NCBIRank.SPECIES,
+            103: NCBIRank.ISOLATE,
+        }
+
+        mocker.patch("ref_builder.ncbi.client.Entrez.esearch")
+        mocker.patch(
+            "ref_builder.ncbi.client.Entrez.read",
+            return_value={"IdList": ["100", "101", "102", "103", "104"]},
+        )
+
+        fetch_taxonomy_record = mocker.patch.object(
+            uncached_ncbi_client,
+            "fetch_taxonomy_record",
+            side_effect=lambda taxid: (
+                mocker.Mock(rank=ranks[taxid]) if taxid in ranks else None
+            ),
+        )
+
+        assert uncached_ncbi_client.fetch_descendant_taxids(100) == [101, 103]
+        assert sorted(call.args[0] for call in fetch_taxonomy_record.mock_calls) == [
+            101,
+            102,
+            103,
+            104,
+        ]
+
 
 def test_filter_accessions():
     """Test that accession filter only allows valid versioned accessions to pass."""
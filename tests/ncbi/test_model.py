@@ -2,6 +2,7 @@ import pytest
 from pydantic import ValidationError
 from syrupy.assertion import SnapshotAssertion
 
+from ref_builder.models.accession import Accession
 from ref_builder.ncbi.cache import NCBICache
 from ref_builder.ncbi.models import NCBIGenbank, NCBILineage, NCBIRank, NCBITaxonomy
 
@@ -38,6 +39,17 @@ class TestParseGenbank:
         record = scratch_ncbi_cache.load_genbank_record("AB017504")
         assert NCBIGenbank(**record).source.taxid == 1169032
 
+    def test_versioned_accession(self, scratch_ncbi_cache: NCBICache):
+        """Test that the versioned accession is parsed from the accession version."""
+        record = NCBIGenbank.model_validate(
+            scratch_ncbi_cache.load_genbank_record("AB017504")
+        )
+
+        assert record.versioned_accession == Accession.from_string(
+            record.accession_version
+        )
+        assert record.versioned_accession.key == record.accession
+
     def test_sequence_validation_fail(self, scratch_ncbi_cache: NCBICache):
         """Test that validation fails when the sequence contains invalid characters."""
         record = scratch_ncbi_cache.load_genbank_record("AB017504")
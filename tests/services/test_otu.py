@@ -3,10 +3,11 @@ from uuid import uuid4
 import pytest
 from pytest_mock import MockerFixture
 
-from ref_builder.errors import OTUExistsError
+from ref_builder.errors import DuplicateAccessionError, OTUExistsError
 from ref_builder.models.otu import OTU
 from ref_builder.ncbi.client import NCBIClientProtocol
 from ref_builder.ncbi.models import NCBIRank
+from ref_builder.promote import promote_otu_from_records
 from ref_builder.repo import Repo
 from ref_builder.services.cls import Services
 from ref_builder.services.otu import OTUService
@@ -14,6 +15,7 @@ from tests.fixtures.factories import (
     NCBIGenbankFactory,
     NCBITaxonomyFactory,
 )
+from tests.fixtures.mock_ncbi_client import MockNCBIClient
 
 
 @pytest.fixture
@@ -190,6 +192,72 @@ class TestCreate:
         assert exc_info.value.taxid == 3432891
         assert exc_info.value.otu_id == otu.id
 
+    def test_duplicate_accessions(
+        self,
+        mocker: MockerFixture,
+        ncbi_genbank_factory: type[NCBIGenbankFactory],
+        otu_service: OTUService,
+    ):
+        """Test that repeated and padded accessions are only fetched once."""
+        records = [ncbi_genbank_factory.build()]
+
+        otu_service.ncbi.fetch_genbank_records = mocker.Mock(return_value=records)
+        otu_service.ncbi.fetch_taxonomy_record = mocker.Mock(return_value=None)
+
+        accession = records[0].accession
+
+        otu_service.create([accession, f" {accession} ", accession])
+
+        otu_service.ncbi.fetch_genbank_records.assert_called_once_with([accession])
+
+    def test_accession_in_repo(
+        self,
+        empty_repo: Repo,
+        mocker: MockerFixture,
+        otu_service: OTUService,
+    ):
+        """Test that accessions already in the repo are rejected before fetching."""
+        with empty_repo.lock():
+            otu = otu_service.create(["NC_001367"])
+
+        assert otu is not None
+
+        spy = mocker.spy(otu_service.ncbi, "fetch_genbank_records")
+
+        with pytest.raises(DuplicateAccessionError), empty_repo.lock():
+            otu_service.create(["NC_001367.1"])
+
+        assert spy.call_count == 0
+
+
+class TestGetOTU:
+    """Test OTU retrieval by identifier."""
+
+    def test_ok(self, empty_repo: Repo, otu_service: OTUService):
+        """Test that an OTU can be retrieved by its ID or taxid."""
+        with empty_repo.lock():
+            otu = otu_service.create(["NC_001367"])
+
+        assert otu is not None
+
+        assert otu_service.get_otu(str(otu.id)) == otu
+        assert otu_service.get_otu(str(otu.taxid)) == otu
+
+    @pytest.mark.parametrize(
+        "identifier",
+        [
+            "",
+            "not-an-otu",
+            "²",
+            "12345678x1234x1234x1234x123456789012",
+            "zzzzzzzz-zzzz-zzzz-zzzz-zzzzzzzzzzzz",
+            str(uuid4()),
+        ],
+    )
+    def test_not_found(self, identifier: str, otu_service: OTUService):
+        """Test that unknown or malformed identifiers return None."""
+        assert otu_service.get_otu(identifier) is None
+
 
 class TestSetPlan:
     """Test plan creation failures."""
@@ -398,3 +466,75 @@ class TestUpdate:
         isolate_after = otu_after.get_isolate(isolate_before.id)
         assert isolate_after
         assert isolate_after.accessions == {"NC_004452"}
+
+    def test_single_fetch(
+        self,
+        empty_repo: Repo,
+        otu_service: OTUService,
+        mock_ncbi_client: MockNCBIClient,
+        mocker: MockerFixture,
+    ):
+        """Test that an update searches and fetches from NCBI only once."""
+        with empty_repo.lock():
+            otu = otu_service.create(["V01408"])
+
+        assert otu is not None
+
+        search = mocker.patch.object(
+            mock_ncbi_client,
+            "fetch_accessions_by_taxid",
+            wraps=mock_ncbi_client.fetch_accessions_by_taxid,
+        )
+        fetch = mocker.patch.object(
+            mock_ncbi_client,
+            "fetch_genbank_records",
+            wraps=mock_ncbi_client.fetch_genbank_records,
+        )
+
+        with empty_repo.lock():
+            updated_otu = otu_service.update(otu.id)
+
+        assert updated_otu is not None
+        assert "NC_001367" in updated_otu.accessions
+
+        assert search.call_count == 1
+        assert fetch.call_count == 1
+
+    def test_promote_refseq_only(
+        self,
+        empty_repo: Repo,
+        otu_service: OTUService,
+        mock_ncbi_client: MockNCBIClient,
+        mocker: MockerFixture,
+    ):
+        """Test that only RefSeq records from the shared search are considered for
+        promotion.
+        """
+        with empty_repo.lock():
+            otu = otu_service.create(["V01408"])
+
+        assert otu is not None
+
+        fetch = mocker.patch.object(
+            mock_ncbi_client,
+            "fetch_genbank_records",
+            wraps=mock_ncbi_client.fetch_genbank_records,
+        )
+        promote = mocker.patch(
+            "ref_builder.services.otu.promote_otu_from_records",
+            wraps=promote_otu_from_records,
+        )
+
+        with empty_repo.lock():
+            updated_otu = otu_service.update(otu.id)
+
+        assert updated_otu is not None
+        assert "NC_001367" in updated_otu.accessions
+
+        # Non-RefSeq records are fetched for the new isolate step.
+        assert "OQ953825" in fetch.call_args.args[0]
+
+        assert promote.call_count == 1
+        assert [record.accession for record in promote.call_args.args[2]] == [
+            "NC_001367"
+        ]
@@ -0,0 +1,293 @@
+import datetime as dt
+
+import arrow
+from pytest_mock import MockerFixture
+
+from ref_builder.models.accession import Accession
+from ref_builder.ncbi.client import NCBIClientProtocol
+from ref_builder.repo import Repo
+from ref_builder.services.cls import Services
+from ref_builder.services.isolate import IsolateService
+from ref_builder.services.repo import (
+    UPDATE_SEARCH_MARGIN_IN_DAYS,
+    _fetch_new_accessions,
+    _fetch_new_records,
+)
+from tests.fixtures.factories import NCBIGenbankFactory
+from tests.fixtures.mock_ncbi_client import MockNCBIClient
+
+
+def test_fetch_new_records(
+    mocker: MockerFixture, ncbi_genbank_factory: type[NCBIGenbankFactory]
+):
+    """Test that every page of accessions is fetched and the records are merged."""
+    records = ncbi_genbank_factory.batch(5)
+
+    records_by_accession = {record.accession: record for record in records}
+
+    ncbi = mocker.Mock(ignore_cache=False)
+    ncbi.fetch_genbank_records.side_effect = lambda page: [
+        records_by_accession[accession] for accession in page
+    ]
+
+    assert (
+        _fetch_new_records(ncbi, list(records_by_accession), chunk_size=2)
+        == records_by_accession
+    )
+
+    page_sizes = sorted(
+        len(call.args[0]) for call in ncbi.fetch_genbank_records.mock_calls
+    )
+
+    assert page_sizes == [1, 2, 2]
+
+
+def test_update_skips_cooling_otus(
+    mocker: MockerFixture,
+    mock_ncbi_client: NCBIClientProtocol,
+    scratch_repo: Repo,
+):
+    """Test that OTUs updated within the cooldown period are not loaded."""
+    with scratch_repo.lock():
+        for otu in scratch_repo.iter_minimal_otus():
+            scratch_repo.write_otu_update_history_entry(otu.id)
+
+    get_otu = mocker.spy(scratch_repo, "get_otu")
+
+    with scratch_repo.lock():
+        assert Services(scratch_repo, mock_ncbi_client).repo.update() == set()
+
+    get_otu.assert_not_called()
+
+
+def test_update_searches_since_last_update(mocker: MockerFixture, scratch_repo: Repo):
+    """Test that OTUs unchanged since their last update are only searched for records
+    modified shortly before that update.
+    """
+    last_updated = arrow.utcnow().shift(days=1)
+
+    mocker.patch("ref_builder.repo.arrow.utcnow", return_value=last_updated)
+
+    with scratch_repo.lock():
+        for otu in scratch_repo.iter_minimal_otus():
+            scratch_repo.write_otu_update_history_entry(otu.id)
+
+    mocker.patch(
+        "ref_builder.services.repo.arrow.utcnow",
+        return_value=last_updated.shift(days=30),
+    )
+
+    ncbi = mocker.Mock(ignore_cache=False)
+    ncbi.fetch_accessions_by_taxid.return_value = []
+
+    with scratch_repo.lock():
+        assert Services(scratch_repo, ncbi).repo.update() == set()
+
+    assert ncbi.fetch_accessions_by_taxid.mock_calls
+
+    assert {
+        call.kwargs["modification_date_start"]
+        for call in ncbi.fetch_accessions_by_taxid.mock_calls
+    } == {last_updated.shift(days=-UPDATE_SEARCH_MARGIN_IN_DAYS).date()}
+
+
+def test_update_searches_modified_otus_in_full(
+    mocker: MockerFixture, scratch_repo: Repo
+):
+    """Test that OTUs changed since their last update are searched for records
+    regardless of modification date.
+    """
+    utcnow = mocker.patch(
+        "ref_builder.repo.arrow.utcnow", return_value=arrow.utcnow().shift(days=-30)
+    )
+
+    with scratch_repo.lock():
+        for otu in scratch_repo.iter_minimal_otus():
+            scratch_repo.write_otu_update_history_entry(otu.id)
+
+    mocker.stop(utcnow)
+
+    ncbi = mocker.Mock(ignore_cache=False)
+    ncbi.fetch_accessions_by_taxid.return_value = []
+
+    with scratch_repo.lock():
+        assert Services(scratch_repo, ncbi).repo.update() == set()
+
+    assert ncbi.fetch_accessions_by_taxid.mock_calls
+
+    assert {
+        call.kwargs["modification_date_start"]
+        for call in ncbi.fetch_accessions_by_taxid.mock_calls
+    } == {None}
+
+
+def test_update_failed_isolate_recorded(
+    mocker: MockerFixture,
+    ncbi_genbank_factory: type[NCBIGenbankFactory],
+    scratch_repo: Repo,
+):
+    """Test that an update is recorded for an OTU whose new isolate could not be
+    created, along with the accessions to fetch again in the next update.
+    """
+    otu = scratch_repo.get_otu(next(scratch_repo.iter_minimal_otus()).id)
+
+    assert otu is not None
+
+    record = ncbi_genbank_factory.build(
+        accession="ZZ000001", accession_version="ZZ000001.1"
+    )
+
+    ncbi = mocker.Mock(ignore_cache=False)
+    ncbi.fetch_accessions_by_taxid.side_effect = lambda taxid, **_: (
+        [Accession(key="ZZ000001", version=1)] if taxid == otu.taxid else []
+    )
+    ncbi.fetch_genbank_records.return_value = [record]
+
+    mocker.patch.object(
+        IsolateService, "create_from_records", side_effect=ValueError("Bad isolate")
+    )
+
+    with scratch_repo.lock():
+        assert Services(scratch_repo, ncbi).repo.update() == set()
+
+    assert scratch_repo.get_otu_last_updated(otu.id) is not None
+    assert scratch_repo.get_otu_unused_accessions()[otu.id] == {"ZZ000001"}
+
+
+def test_update_incomplete_isolate(
+    mocker: MockerFixture,
+    empty_repo: Repo,
+    mock_ncbi_client: MockNCBIClient,
+):
+    """Test that the records of an incomplete isolate are fetched again, so the
+    isolate is created once its missing segment is available.
+    """
+    services = Services(empty_repo, mock_ncbi_client)
+
+    with empty_repo.lock():
+        otu = services.otu.create(
+            [
+                "EF546808",
+                "EF546809",
+                "EF546810",
+                "EF546811",
+                "EF546812",
+                "EF546813",
+            ]
+        )
+
+    assert otu
+
+    isolate_accessions = [
+        "EF546802",
+        "EF546803",
+        "EF546804",
+        "EF546805",
+        "EF546806",
+        "EF546807",
+    ]
+
+    # The last segment is not available yet.
+    available_accessions = isolate_accessions[:-1]
+    modified_accessions = []
+
+    def fetch_accessions_by_taxid(
+        taxid: int, modification_date_start: dt.date | None = None, **_: object
+    ) -> list[Accession]:
+        if taxid != otu.taxid:
+            return []
+
+        keys = (
+            available_accessions
+            if modification_date_start is None
+            else modified_accessions
+        )
+
+        return [Accession(key=key, version=1) for key in keys]
+
+    mocker.patch.object(
+        mock_ncbi_client,
+        "fetch_accessions_by_taxid",
+        side_effect=fetch_accessions_by_taxid,
+    )
+
+    with empty_repo.lock():
+        assert services.repo.update() == set()
+
+    assert empty_repo.get_otu_last_updated(otu.id) is not None
+    assert empty_repo.get_otu_unused_accessions()[otu.id] == set(
+        isolate_accessions[:-1]
+    )
+
+    # Only the missing segment has been modified since the last update.
+    available_accessions.append("EF546807")
+    modified_accessions.append("EF546807")
+
+    mocker.patch(
+        "ref_builder.services.repo.arrow.utcnow",
+        return_value=arrow.utcnow().shift(days=30),
+    )
+
+    with empty_repo.lock():
+        assert services.repo.update() == {otu.id}
+
+    # The first update searched in full and the second only for modified records.
+    assert [
+        call.kwargs["modification_date_start"] is None
+        for call in mock_ncbi_client.fetch_accessions_by_taxid.mock_calls
+    ] == [True, False]
+
+    otu = empty_repo.get_otu(otu.id)
+
+    assert otu
+    assert otu.accessions.issuperset(isolate_accessions)
+    assert empty_repo.get_otu_unused_accessions().get(otu.id) is None
+
+
+def test_fetch_new_accessions(mocker: MockerFixture, scratch_repo: Repo):
+    """Test that accessions blocked by the OTU or stored anywhere in the repo are not
+    fetched.
+    """
+    otu = scratch_repo.get_otu(next(scratch_repo.iter_minimal_otus()).id)
+
+    assert otu is not None
+
+    repo_accession = "ZZ000001"
+
+    ncbi = mocker.Mock()
+    ncbi.fetch_accessions_by_taxid.return_value = [
+        Accession(key=key, version=1)
+        for key in [*otu.blocked_accessions, repo_accession, "ZZ000002"]
+    ]
+
+    assert _fetch_new_accessions(
+        ncbi, [otu], repo_blocked_accessions={repo_accession}
+    ) == {otu.taxid: {"ZZ000002"}}
+
+
+def test_fetch_new_accessions_modified_since(mocker: MockerFixture, scratch_repo: Repo):
+    """Test that the search for an OTU is limited to records modified since the given
+    date.
+    """
+    otu = scratch_repo.get_otu(next(scratch_repo.iter_minimal_otus()).id)
+
+    assert otu is not None
+
+    modified_since = dt.date(2025, 1, 1)
+
+    ncbi = mocker.Mock()
+    ncbi.fetch_accessions_by_taxid.return_value = []
+
+    assert (
+        _fetch_new_accessions(
+            ncbi, [otu], modified_since_by_otu_id={otu.id: modified_since}
+        )
+        == {}
+    )
+
+    ncbi.fetch_accessions_by_taxid.assert_called_once_with(
+        otu.taxid,
+        sequence_min_length=otu.plan.min_segment_length,
+        sequence_max_length=otu.plan.max_segment_length,
+        modification_date_start=modified_since,
+    )
@@ -71,10 +71,9 @@ class TestBuildFasta:
 
         fasta_content = fasta_path.read_text()
 
-        repo = Repo(scratch_repo.path)
         expected_accessions = set()
 
-        for otu in repo.iter_otus():
+        for otu in scratch_repo.iter_otus():
             for isolate in otu.isolates:
                 for sequence in isolate.sequences:
                     expected_accessions.add(str(sequence.accession))
@@ -6,7 +6,7 @@ from pathlib import Path
 import arrow
 import pytest
 
-from ref_builder.index import EventIndexItem, Index
+from ref_builder.index import EventIndexItem, Index, OTUTimestamps
 from ref_builder.models.otu import OTU, OTUMinimal
 from ref_builder.ncbi.client import NCBIClientProtocol
 from ref_builder.repo import Repo
@@ -149,6 +149,61 @@ class TestEvents:
 
         assert index.get_latest_timestamp_by_otu_id(otu.id) == second_timestamp
 
+    def test_get_otu_timestamps(self, index: Index, indexable_otus: list[OTU]):
+        """Test ``.get_otu_timestamps()`` retrieves the timestamps of every OTU in one
+        call.
+        """
+        otu, other_otu = indexable_otus[:2]
+
+        first_timestamp = arrow.utcnow().naive
+        latest_timestamp = arrow.utcnow().shift(minutes=1).naive
+        other_timestamp = arrow.utcnow().shift(minutes=2).naive
+
+        index.add_event_id(100, otu.id, first_timestamp)
+        index.add_event_id(101, other_otu.id, other_timestamp)
+        index.add_event_id(104, otu.id, latest_timestamp)
+
+        update_timestamp = arrow.utcnow().shift(minutes=3).naive
+
+        index.add_otu_update_history_entry(other_otu.id, update_timestamp)
+
+        assert index.get_otu_timestamps() == {
+            otu.id: OTUTimestamps(
+                first_created=first_timestamp,
+                last_modified=latest_timestamp,
+                last_updated=None,
+            ),
+            other_otu.id: OTUTimestamps(
+                first_created=other_timestamp,
+                last_modified=other_timestamp,
+                last_updated=update_timestamp,
+            ),
+        }
+
+    def test_get_unused_accession_keys(self, index: Index, indexable_otus: list[OTU]):
+        """Test that only the unused accession keys of each OTU's latest update are
+        retrieved.
+        """
+        otu, other_otu, updated_otu = indexable_otus[:3]
+
+        timestamp = arrow.utcnow().naive
+
+        index.add_otu_update_history_entry(
+            otu.id, timestamp, unused_accession_keys=["AB000001", "AB000002"]
+        )
+        index.add_otu_update_history_entry(
+            other_otu.id, timestamp, unused_accession_keys=["AB000003"]
+        )
+        index.add_otu_update_history_entry(
+            updated_otu.id, timestamp, unused_accession_keys=["AB000004"]
+        )
+        index.add_otu_update_history_entry(updated_otu.id, timestamp)
+
+        assert index.get_unused_accession_keys() == {
+            otu.id: {"AB000001", "AB000002"},
+            other_otu.id: {"AB000003"},
+        }
+
 
 class TestGetIDByTaxid:
     """Test `Index.get_id_by_taxid`."""
@@ -168,6 +223,14 @@ class TestGetIDByTaxid:
         """Test that `None` is returned when the taxid is not found."""
         assert index.get_id_by_taxid(999999999999999) is None
 
+    def test_many(self, index: Index, indexable_otus: list[OTU]):
+        """Test that OTU IDs are retrieved for many taxids in one lookup, omitting
+        taxids that are not found.
+        """
+        expected = {otu.taxid: otu.id for otu in indexable_otus}
+
+        assert index.get_ids_by_taxids([*expected, 999999999999999]) == expected
+
     def test_subspecies_taxid_lookup(
         self, empty_repo: Repo, mock_ncbi_client: NCBIClientProtocol
     ):
@@ -207,3 +270,58 @@ class TestGetIDByIsolateID:
             first_isolate = next(iter(otu.isolate_ids))
 
             assert index.get_id_by_isolate_id(first_isolate) == otu.id
+
+
+class TestGetOTUIDsByAccessionKeys:
+    """Test `Index.get_otu_ids_by_accession_keys`."""
+
+    def test_ok(self, index: Index, indexable_otus: list[OTU]):
+        """Test that every owned accession key maps to its OTU in one lookup."""
+        expected = {key: otu.id for otu in indexable_otus for key in otu.accessions}
+
+        assert index.get_otu_ids_by_accession_keys(expected.keys()) == expected
+
+    def test_unowned_omitted(self, index: Index, indexable_otus: list[OTU]):
+        """Test that keys not owned by any OTU are omitted."""
+        otu = indexable_otus[0]
+        key = next(iter(otu.accessions))
+
+        assert index.get_otu_ids_by_accession_keys([key, "ZZ999999"]) == {key: otu.id}
+
+    def test_empty(self, index: Index):
+        """Test that an empty collection of keys returns an empty dictionary."""
+        assert index.get_otu_ids_by_accession_keys([]) == {}
+
+
+class TestTransaction:
+    """Test grouping index writes into a single transaction."""
+
+    def test_ok(self, indexable_otus: list[OTU], tmp_path: Path):
+        """Test that writes in a transaction are committed together."""
+        index = Index(tmp_path / "index.db")
+
+        with index.transaction():
+            for otu in indexable_otus:
+                index.upsert_otu(otu, 100)
+
+            assert index.con.in_transaction
+
+        assert not index.con.in_transaction
+        assert index.otu_ids == {otu.id for otu in indexable_otus}
+
+    def test_rollback(self, indexable_otus: list[OTU], tmp_path: Path):
+        """Test that all writes are rolled back when an exception is raised."""
+        index = Index(tmp_path / "index.db")
+
+        def upsert_otus_and_fail() -> None:
+            with index.transaction():
+                for otu in indexable_otus:
+                    index.upsert_otu(otu, 100)
+
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            upsert_otus_and_fail()
+
+        assert not index.con.in_transaction
+        assert index.otu_ids == set()
@@ -0,0 +1,22 @@
+from ref_builder.logs import _sort_sets
+
+
+def test_sort_sets():
+    """Test that set values are rendered as sorted lists and other values are kept."""
+    event_dict = _sort_sets(
+        None,
+        "info",
+        {
+            "event": "Updated excluded accession list.",
+            "excluded_accessions": {"MN908947", "AB017504"},
+            "taxids": frozenset({12242, 438782}),
+            "otu_id": "c4e2b3d1",
+        },
+    )
+
+    assert event_dict == {
+        "event": "Updated excluded accession list.",
+        "excluded_accessions": ["AB017504", "MN908947"],
+        "taxids": [12242, 438782],
+        "otu_id": "c4e2b3d1",
+    }
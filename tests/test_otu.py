@@ -116,7 +116,7 @@ class TestAssignRecordsToSegments:
 
         assert {
             (segment_names_by_id[segment_id], record.accession, record.source.segment)
-            for segment_id, record in assigned_records.items()
+            for segment_id, record in assigned_records
         } == snapshot()
 
     def test_names_not_in_plan(
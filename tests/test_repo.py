@@ -3,6 +3,7 @@ from uuid import UUID, uuid4
 
 import orjson
 import pytest
+from pytest_mock import MockerFixture
 from structlog.testing import capture_logs
 
 from ref_builder.errors import DuplicateAccessionError
@@ -16,6 +17,7 @@ from ref_builder.models.plan import Plan, Segment, SegmentRule
 from ref_builder.models.sequence import Sequence
 from ref_builder.ncbi.models import NCBIRank
 from ref_builder.repo import GITIGNORE_CONTENTS, Repo
+from ref_builder.warnings import PlanWarning
 
 SEGMENT_LENGTH = 15
 
@@ -380,7 +382,9 @@ class TestCreateOTU:
                 )
 
     def test_plan_required_segment_warning(self, empty_repo: Repo):
-        """Test that missing required segments raises a warning."""
+        """Test that missing required segments raises a warning that is logged and
+        reaches the caller of each write.
+        """
         plan = Plan.new(
             segments=[
                 Segment(
@@ -404,34 +408,36 @@ class TestCreateOTU:
             capture_logs() as captured_logs,
             empty_repo.lock(),
         ):
-            otu = empty_repo.create_otu(
-                isolate=isolate_data,
-                lineage=TMV_LINEAGE,
-                molecule=Molecule(
-                    strandedness=Strandedness.SINGLE,
-                    type=MoleculeType.RNA,
-                    topology=Topology.LINEAR,
-                ),
-                plan=plan,
-                promoted_accessions=set(),
-            )
+            with pytest.warns(PlanWarning):
+                otu = empty_repo.create_otu(
+                    isolate=isolate_data,
+                    lineage=TMV_LINEAGE,
+                    molecule=Molecule(
+                        strandedness=Strandedness.SINGLE,
+                        type=MoleculeType.RNA,
+                        topology=Topology.LINEAR,
+                    ),
+                    plan=plan,
+                    promoted_accessions=set(),
+                )
 
             assert otu
 
-            isolate = empty_repo.create_isolate(
-                otu.id,
-                isolate_id=uuid4(),
-                name=IsolateName(IsolateNameType.ISOLATE, "A"),
-                taxid=12227,
-                sequences=[
-                    Sequence(
-                        accession=Accession(key="TM000001", version=1),
-                        definition="TMV",
-                        segment=otu.plan.segments[0].id,
-                        sequence="ACGTACGTACGTACG",
-                    )
-                ],
-            )
+            with pytest.warns(PlanWarning):
+                isolate = empty_repo.create_isolate(
+                    otu.id,
+                    isolate_id=uuid4(),
+                    name=IsolateName(IsolateNameType.ISOLATE, "A"),
+                    taxid=12227,
+                    sequences=[
+                        Sequence(
+                            accession=Accession(key="TM000001", version=1),
+                            definition="TMV",
+                            segment=otu.plan.segments[0].id,
+                            sequence="ACGTACGTACGTACG",
+                        )
+                    ],
+                )
 
             assert isolate
 
@@ -714,6 +720,78 @@ class TestGetOTU:
             "TL44322",
         }
 
+    def test_cached_copy(self, initialized_repo: Repo):
+        """Test that repeated retrievals return equal but independent OTU objects."""
+        otu_id = initialized_repo.get_otu_id_by_taxid(3432891)
+
+        first = initialized_repo.get_otu(otu_id)
+        second = initialized_repo.get_otu(otu_id)
+
+        assert first == second
+        assert first is not second
+
+        first.excluded_accessions.add("TM999999")
+
+        assert "TM999999" not in initialized_repo.get_otu(otu_id).excluded_accessions
+
+    def test_cache_invalidated_by_event(self, initialized_repo: Repo):
+        """Test that a cached OTU is not returned after a new event is written."""
+        otu_id = initialized_repo.get_otu_id_by_taxid(3432891)
+
+        assert initialized_repo.get_otu(otu_id).excluded_accessions == set()
+
+        with initialized_repo.lock():
+            initialized_repo.exclude_accessions(otu_id, {"TM100021"})
+
+        assert initialized_repo.get_otu(otu_id).excluded_accessions == {"TM100021"}
+
+    def test_write_does_not_replay(self, initialized_repo: Repo, mocker: MockerFixture):
+        """Test that reading an OTU after writing to it does not replay its events."""
+        otu_id = initialized_repo.get_otu_id_by_taxid(3432891)
+
+        rehydrate = mocker.spy(Repo, "_rehydrate_otu")
+
+        with initialized_repo.lock():
+            initialized_repo.exclude_accessions(otu_id, {"TM100021"})
+
+        assert initialized_repo.get_otu(otu_id).excluded_accessions == {"TM100021"}
+        assert rehydrate.call_count == 0
+
+    def test_cache_evicts_least_recently_used(
+        self, scratch_repo: Repo, mocker: MockerFixture
+    ):
+        """Test that the least recently used OTU is evicted when the cache is full."""
+        mocker.patch("ref_builder.repo.OTU_CACHE_SIZE", 1)
+
+        repo = Repo(scratch_repo.path)
+        first_id, second_id = [otu.id for otu in repo.iter_minimal_otus()][:2]
+
+        rehydrate = mocker.spy(Repo, "_rehydrate_otu")
+
+        repo.get_otu(first_id)
+        repo.get_otu(first_id)
+
+        assert rehydrate.call_count == 1
+
+        repo.get_otu(second_id)
+        repo.get_otu(first_id)
+
+        assert rehydrate.call_count == 3
+
+    def test_iter_otus_not_cached(self, scratch_repo: Repo, mocker: MockerFixture):
+        """Test that iterating over all OTUs does not fill the cache."""
+        repo = Repo(scratch_repo.path)
+
+        rehydrate = mocker.spy(Repo, "_rehydrate_otu")
+
+        otu_count = len(list(repo.iter_otus()))
+
+        assert otu_count > 1
+        assert rehydrate.call_count == otu_count
+
+        assert len(list(repo.iter_otus())) == otu_count
+        assert rehydrate.call_count == otu_count * 2
+
 
 def test_get_otu_id_from_isolate_id(initialized_repo: Repo):
     """Test that the OTU id can be retrieved from a isolate ID contained within."""
@@ -813,6 +891,28 @@ class TestExcludeAccessions:
         assert otu_after_second
         assert otu_after_second.excluded_accessions == accessions | {"TM100024"}
 
+    def test_get_excluded_accessions(self, initialized_repo: Repo):
+        """Test that excluded accessions can be read without loading a copy of the
+        OTU, and that mutating the result does not affect the repo.
+        """
+        otu = initialized_repo.get_otu_by_taxid(3432891)
+
+        assert otu
+        assert initialized_repo.get_excluded_accessions(otu.id) == set()
+        assert initialized_repo.get_excluded_accessions(uuid4()) is None
+
+        with initialized_repo.lock():
+            excluded_accessions = initialized_repo.exclude_accessions(
+                otu.id, {"TM100021"}
+            )
+
+        assert excluded_accessions == {"TM100021"}
+        assert initialized_repo.get_excluded_accessions(otu.id) == {"TM100021"}
+
+        excluded_accessions.add("TM100022")
+
+        assert initialized_repo.get_excluded_accessions(otu.id) == {"TM100021"}
+
     def test_existing_accession(self, initialized_repo: Repo):
         """Test that excluding an accession moves its isolate to excluded_isolates."""
         otu = initialized_repo.get_otu_by_taxid(3432891)
@@ -1186,8 +1286,11 @@ class TestMalformedEvent:
         with open(file_path, "wb") as f:
             f.write(orjson.dumps(event))
 
+        # Rehydrated OTUs are cached in-process, so re-open the repo as a fresh process.
+        repo = Repo(initialized_repo.path)
+
         with pytest.raises(ValueError, match="Unknown event type: MalformedEvent"):
-            initialized_repo.get_otu_by_taxid(3432891)
+            repo.get_otu_by_taxid(3432891)
 
     def test_bad_event_data(self, initialized_repo: Repo):
         """Test that an event with bad data cannot be rehydrated."""
@@ -1207,14 +1310,16 @@ class TestMalformedEvent:
         with open(path, "wb") as f:
             f.write(orjson.dumps(event))
 
+        repo = Repo(initialized_repo.path)
+
         with (
-            initialized_repo.lock(),
+            repo.lock(),
             pytest.raises(
                 ValueError,
                 match="Input should be a valid list",
             ),
         ):
-            initialized_repo.get_otu_by_taxid(3432891)
+            repo.get_otu_by_taxid(3432891)
 
 
 def _make_cmv_isolate_data(plan: Plan, accession_key: str) -> CreateIsolateData:
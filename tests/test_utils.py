@@ -1,4 +1,13 @@
-from ref_builder.utils import generate_natural_sort_key
+from pathlib import Path
+
+import pytest
+
+from ref_builder.utils import (
+    filter_accessions,
+    generate_natural_sort_key,
+    is_accession_key_valid,
+    write_file_atomically,
+)
 
 
 def test_generate_natural_sort_key():
@@ -28,3 +37,49 @@ def test_generate_natural_sort_key():
         "RNA 9",
         "RNA 10",
     ]
+
+
+@pytest.mark.parametrize(
+    ("accession_key", "expected"),
+    [
+        ("MN908947", True),
+        ("A12345", True),
+        ("NC_003619", True),
+        ("NC_ABC123", True),
+        ("MN908947.3", False),
+        ("MN908947\n", False),
+        ("NZ_003619", False),
+        ("ABC12345", False),
+        ("", False),
+    ],
+)
+def test_is_accession_key_valid(accession_key: str, expected: bool):
+    """Test that Genbank and RefSeq accession keys are accepted and nothing else is."""
+    assert is_accession_key_valid(accession_key) is expected
+
+
+def test_write_file_atomically(tmp_path: Path):
+    """Test that the file is replaced and no temporary files are left behind."""
+    path = tmp_path / "data.json"
+    path.write_bytes(b"old")
+
+    write_file_atomically(path, b"new")
+
+    assert path.read_bytes() == b"new"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_filter_accessions():
+    """Test that blocked accessions are removed and the input order is kept."""
+    assert filter_accessions(
+        iter(["MN000003", "MN000001", "MN000002"]), frozenset({"MN000001"})
+    ) == ["MN000003", "MN000002"]
+
+
+def test_filter_accessions_many_blocked():
+    """Test that accessions in any of the blocked sets are removed."""
+    assert filter_accessions(
+        ["MN000003", "MN000001", "MN000002", "MN000004"],
+        frozenset({"MN000001"}),
+        {"MN000004"},
+    ) == ["MN000003", "MN000002"]